@@ -0,0 +1,36 @@
+#Paquete kruskal: árboles de expansión mínima y máxima con el algoritmo de Kruskal.
+#Importar el paquete solo carga el núcleo (Graph, DisjointSet, TreeCache, TreeCursor, Profiler,
+#KruskalStats); los demás módulos (flujo, motores paralelos, lotes, disposición, bosques,
+#cuellos de botella, escenarios, k mejores árboles) se cargan la primera vez que se usa alguno
+#de sus nombres o el método de Graph que los necesita, y matplotlib/networkx solo al dibujar.
+
+import importlib
+
+from .cache import TreeCache
+from .cursor import TreeCursor
+from .disjoint_set import DisjointSet
+from .graph import Graph
+from .profiling import KruskalStats, Profiler
+
+#Nombre público -> módulo que lo define, para las importaciones diferidas.
+LAZY_NAMES = {
+    'read_edges': 'streaming',
+    'external_sort_edges': 'streaming',
+    'stream_kruskal': 'streaming',
+    'ParallelEngine': 'parallel',
+    'batch_spanning_trees': 'batch',
+    'radial_tree_layout': 'layout',
+    'force_layout': 'layout',
+    'LAYOUT_CACHE': 'layout',
+    'SpanningForest': 'forest',
+    'BottleneckIndex': 'bottleneck',
+    'ScenarioIndex': 'scenarios',
+}
+
+__all__ = ['DisjointSet', 'Graph', 'KruskalStats', 'Profiler', 'TreeCache', 'TreeCursor'] + list(LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in LAZY_NAMES:
+        return getattr(importlib.import_module('.' + LAZY_NAMES[name], __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
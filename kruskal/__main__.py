@@ -0,0 +1,8 @@
+#Permite ejecutar el ejecutor por línea de comandos con python -m kruskal.
+
+import sys
+
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
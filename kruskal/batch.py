@@ -0,0 +1,77 @@
+#Solución por lotes de muchos grafos pequeños empaquetados estilo CSR.
+
+import multiprocessing #Importamos multiprocessing para repartir bloques de grafos entre procesos.
+
+import numpy as np #Importamos numpy para empaquetar y ordenar las aristas de todos los grafos.
+
+from .disjoint_set import DisjointSet
+from .sorting import check_mode, reverse_stable
+
+#Función para calcular los árboles de muchos grafos pequeños de una sola vez.
+#Los grafos vienen empaquetados estilo CSR: las aristas del grafo g ocupan las posiciones
+#edge_offsets[g]:edge_offsets[g + 1] de src, dst y weights, y sus nodos se numeran
+#localmente de 0 a node_counts[g] - 1 (si no se da node_counts se deduce de las aristas).
+#Como los grafos son disjuntos, todos se resuelven con un solo ordenamiento y una sola
+#pasada de union-find; con workers > 1 los grafos se reparten en bloques entre procesos.
+#Devuelve {modo: (tree_offsets, tree_edges)}: las aristas del árbol del grafo g son
+#tree_edges[tree_offsets[g]:tree_offsets[g + 1]], como índices sobre src, dst y weights,
+#en el mismo orden en que las devolvería kruskal.
+def batch_spanning_trees(edge_offsets, src, dst, weights, node_counts=None, modes=('min', 'max'), workers=1):
+    for mode in modes:
+        check_mode(mode)
+    edge_offsets = np.asarray(edge_offsets, dtype=np.int64)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    graph_count = len(edge_offsets) - 1
+    if node_counts is None: #Cada grafo tiene tantos nodos como su mayor id local más uno.
+        edge_graph = np.repeat(np.arange(graph_count), np.diff(edge_offsets))
+        node_counts = np.zeros(graph_count, dtype=np.int64)
+        np.maximum.at(node_counts, edge_graph, np.maximum(src, dst) + 1)
+    node_counts = np.asarray(node_counts, dtype=np.int64)
+
+    if workers <= 1 or graph_count < 2 * workers:
+        return batch_chunk(edge_offsets, src, dst, weights, node_counts, modes)
+
+    #Repartimos los grafos en bloques contiguos y cada proceso resuelve los suyos.
+    bounds = np.linspace(0, graph_count, 4 * workers + 1).astype(np.int64)
+    tasks = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        start, stop = edge_offsets[first], edge_offsets[last]
+        tasks.append((edge_offsets[first:last + 1] - start, src[start:stop], dst[start:stop],
+                      weights[start:stop], node_counts[first:last], modes))
+    with multiprocessing.Pool(workers) as pool:
+        chunks = pool.starmap(batch_chunk, tasks)
+
+    #Unimos los resultados de los bloques desplazando índices y posiciones.
+    results = {}
+    for mode in modes:
+        offsets = [np.zeros(1, dtype=np.int64)]
+        edges = []
+        tree_total = 0
+        for first, chunk in zip(bounds[:-1], chunks):
+            tree_offsets, tree_edges = chunk[mode]
+            offsets.append(tree_offsets[1:] + tree_total)
+            edges.append(tree_edges + edge_offsets[first])
+            tree_total += len(tree_edges)
+        results[mode] = (np.concatenate(offsets), np.concatenate(edges))
+    return results
+
+#Función que resuelve un bloque de grafos empaquetados (ver batch_spanning_trees).
+def batch_chunk(edge_offsets, src, dst, weights, node_counts, modes):
+    graph_count = len(edge_offsets) - 1
+    edge_graph = np.repeat(np.arange(graph_count), np.diff(edge_offsets)) #Grafo al que pertenece cada arista.
+    node_base = np.concatenate([[0], np.cumsum(node_counts)]) #Primer id global de cada grafo.
+    global_src = (src + node_base[edge_graph]).tolist()
+    global_dst = (dst + node_base[edge_graph]).tolist()
+    order = np.argsort(weights, kind='stable') #Único ordenamiento para todos los grafos y modos.
+
+    results = {}
+    for mode in modes:
+        mode_order = order if mode == 'min' else reverse_stable(order, weights)
+        union = DisjointSet(int(node_base[-1])).union
+        accepted = np.array([k for k in mode_order.tolist() if union(global_src[k], global_dst[k])], dtype=np.int64)
+        accepted = accepted[np.argsort(edge_graph[accepted], kind='stable')] #Agrupamos por grafo sin perder el orden.
+        tree_offsets = np.searchsorted(edge_graph[accepted], np.arange(graph_count + 1))
+        results[mode] = (tree_offsets, accepted)
+    return results
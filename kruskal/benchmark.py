@@ -0,0 +1,624 @@
+#Banco de pruebas de rendimiento: generadores de grafos sintéticos con semilla, mediciones de
+#ordenamiento, union-find, Kruskal, dibujo y escalado de los motores paralelos, resultados en
+#JSON comparables contra una línea base y los mapas Mundo/Vida/Trabajo como casos de corrección.
+#Uso: python -m kruskal.benchmark --sizes 10000 1000000 --output resultados.json --baseline base.json
+
+import argparse #Importamos argparse para leer las opciones de la línea de comandos.
+import gc #Importamos gc para apagar el recolector de basura mientras se mide.
+import importlib.util #Importamos importlib.util para cargar los scripts de los mapas como módulos.
+import itertools #Importamos itertools para probar todas las combinaciones de aristas.
+import json #Importamos json para guardar y comparar resultados.
+import math #Importamos math para comparar pesos de árboles.
+import os #Importamos os para saber cuántos núcleos hay.
+import platform #Importamos platform para anotar en qué máquina se midió.
+import statistics #Importamos statistics para resumir las repeticiones.
+import sys #Importamos sys para la salida estándar y de errores.
+import tempfile #Importamos tempfile para guardar los dibujos medidos.
+import time #Importamos time para medir.
+import tracemalloc #Importamos tracemalloc para medir la memoria que retiene cada representación.
+from pathlib import Path #Importamos Path para encontrar los scripts de los mapas.
+
+import numpy as np #Importamos numpy para generar los grafos sintéticos.
+
+from .disjoint_set import DisjointSet
+from .geometry import candidate_edges
+from .graph import ENGINES, Graph
+from .sorting import chunked
+
+#Mapas de los scripts de ejemplo: archivo, peso del árbol mínimo y peso del árbol máximo.
+FIXTURES = {
+    'Mundo': ('01_ArbolMaxMinKruskal_Mundo_V0.py', 11.0, 26.0),
+    'Vida': ('02_ArbolMaxMinKruskal_Vida_V0.py', 21.5, 80.5),
+    'Trabajo': ('03_ArbolMaxMinKruskal_Trabajo_V0.py', 22.0, 110.0),
+}
+
+#Función para generar un grafo disperso aleatorio con unas size aristas y grado medio 8.
+def random_sparse(size, rng):
+    node_count = max(2, size // 4)
+    src = rng.integers(node_count, size=size)
+    dst = rng.integers(node_count, size=size)
+    return src, dst, rng.random(size), None
+
+#Función para generar un grafo completo (o casi) con unas size aristas.
+def dense(size, rng):
+    node_count = max(2, math.ceil((1 + math.sqrt(1 + 8 * size)) / 2))
+    src, dst = np.triu_indices(node_count, 1)
+    keep = np.sort(rng.choice(len(src), size=min(size, len(src)), replace=False))
+    return src[keep], dst[keep], rng.random(len(keep)), None
+
+#Función para generar una cuadrícula con aristas a la derecha y hacia abajo (unas size aristas).
+def grid(size, rng):
+    side = max(2, math.ceil(math.sqrt(size / 2)))
+    ids = np.arange(side * side).reshape(side, side)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    rows, cols = np.divmod(np.arange(side * side), side)
+    return src, dst, rng.random(len(src)), np.column_stack([cols, -rows]).astype(np.float64)
+
+#Función para generar un grafo con grados en ley de potencia (modelo de Chung-Lu, exponente 2.5):
+#cada extremo se elige con probabilidad proporcional al peso esperado de su nodo.
+def power_law(size, rng):
+    node_count = max(2, size // 4)
+    expected = np.arange(1, node_count + 1, dtype=np.float64) ** (-1 / 1.5)
+    expected /= expected.sum()
+    src = rng.choice(node_count, size=size, p=expected)
+    dst = rng.choice(node_count, size=size, p=expected)
+    return src, dst, rng.random(size), None
+
+#Función para generar un grafo geométrico aleatorio: puntos en el cuadrado unidad unidos si están
+#a menos de radius (elegido para grado medio 8), con la distancia como peso. Los puntos se
+#reparten en franjas horizontales de alto radius y solo se comparan vecinos cercanos en x
+#dentro de la misma franja o con la franja de arriba.
+def geometric(size, rng):
+    node_count = max(2, size // 4)
+    radius = math.sqrt(8 / (math.pi * node_count))
+    coords = rng.random((node_count, 2))
+    strip = (coords[:, 1] // radius).astype(np.int64)
+    #Cada punto aparece en su franja y, marcado como copia, en la franja de abajo.
+    points = np.concatenate([np.arange(node_count), np.arange(node_count)])
+    keys = np.concatenate([strip, strip - 1])
+    copies = np.repeat([False, True], node_count)
+    order = np.lexsort((coords[points, 0], keys))
+    points, keys, copies = points[order], keys[order], copies[order]
+    x = coords[points, 0]
+    src, dst = [], []
+    for shift in range(1, len(points)):
+        near = (keys[shift:] == keys[:-shift]) & (x[shift:] - x[:-shift] < radius)
+        if not near.any(): #En cada franja x está ordenado: si nadie está cerca, tampoco más lejos.
+            break
+        #Parejas dentro de la franja (sin copias) o entre un punto y una copia de la franja de arriba.
+        near &= ~(copies[shift:] & copies[:-shift])
+        first, second = points[:-shift][near], points[shift:][near]
+        src.append(first)
+        dst.append(second)
+    src = np.concatenate(src) if src else np.zeros(0, dtype=np.int64)
+    dst = np.concatenate(dst) if dst else np.zeros(0, dtype=np.int64)
+    distance = np.hypot(*(coords[src] - coords[dst]).T)
+    close = (distance < radius) & (src != dst)
+    return src[close], dst[close], distance[close], coords
+
+GENERATORS = {
+    'random-sparse': random_sparse,
+    'dense': dense,
+    'grid': grid,
+    'power-law': power_law,
+    'geometric': geometric,
+}
+
+#Función para generar un grafo sintético reproducible. Devuelve el grafo y las posiciones de sus
+#nodos (None si el generador no las tiene).
+def generate(kind, size, seed=0):
+    src, dst, weights, coords = GENERATORS[kind](size, np.random.default_rng(seed))
+    graph = Graph()
+    graph.add_edges(src, dst, weights)
+    positions = None
+    if coords is not None:
+        positions = {label: tuple(coords[label]) for label in graph.labels}
+    return graph, positions
+
+#Función para medir una función al estilo de pyperf: calentamiento, repeticiones con el recolector
+#de basura apagado y resumen (mínimo, mediana, media y desviación) en segundos. setup prepara los
+#argumentos de cada repetición fuera de la medición.
+def measure(function, setup=tuple, repeat=5, warmup=1):
+    runs = []
+    for index in range(warmup + repeat):
+        args = setup()
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function(*args)
+            elapsed = time.perf_counter() - start
+        finally:
+            if collecting:
+                gc.enable()
+        if index >= warmup:
+            runs.append(elapsed)
+    return {
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'mean': statistics.fmean(runs),
+        'stdev': statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        'runs': runs,
+    }
+
+#Función con la pasada de union-find de Kruskal sobre DisjointSet (ids enteros y arreglos).
+def array_scan(node_count, src, dst):
+    union = DisjointSet(node_count).union
+    return sum(1 for k in range(len(src)) if union(src[k], dst[k]))
+
+#Función con la pasada de union-find original de los scripts: diccionarios por etiqueta,
+#find recursivo con compresión de caminos y unión por rango. Sirve de referencia.
+def dict_scan(labels, src, dst):
+    parent = {label: label for label in labels}
+    rank = dict.fromkeys(labels, 0)
+
+    def find(node):
+        if parent[node] != node:
+            parent[node] = find(parent[node])
+        return parent[node]
+
+    accepted = 0
+    for x, y in zip(src, dst):
+        x_root, y_root = find(x), find(y)
+        if x_root == y_root:
+            continue
+        if rank[x_root] < rank[y_root]:
+            parent[x_root] = y_root
+        elif rank[x_root] > rank[y_root]:
+            parent[y_root] = x_root
+        else:
+            parent[y_root] = x_root
+            rank[x_root] += 1
+        accepted += 1
+    return accepted
+
+#Mediciones de ordenamiento: ascendente, descendente y descendente derivado del ascendente.
+def sort_suite(graph, positions, options):
+    order = graph.sorted_order(True)
+    yield 'ascending', measure(graph.sorted_order, lambda: (True,), options.repeat)
+    yield 'descending', measure(graph.sorted_order, lambda: (False,), options.repeat)
+    yield 'reverse', measure(graph.reverse_order, lambda: (order,), options.repeat)
+
+#Mediciones de la pasada de union-find: arreglos frente a los diccionarios originales.
+def union_find_suite(graph, positions, options):
+    order = graph.sorted_order(True)
+    src = np.frombuffer(graph.src, dtype=np.intc)[order].tolist()
+    dst = np.frombuffer(graph.dst, dtype=np.intc)[order].tolist()
+    yield 'array', measure(array_scan, lambda: (len(graph.labels), src, dst), options.repeat)
+    names = [f'n{node_id}' for node_id in range(len(graph.labels))] #Etiquetas de texto como en los mapas.
+    src_names = [names[node_id] for node_id in src]
+    dst_names = [names[node_id] for node_id in dst]
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10000)) #El find recursivo original puede bajar muchos niveles.
+    try:
+        yield 'dict', measure(dict_scan, lambda: (names, src_names, dst_names), options.repeat)
+    finally:
+        sys.setrecursionlimit(limit)
+
+#Mediciones de Kruskal completo: cada árbol por separado (ordenando todo o con selección
+#perezosa) y ambos con un solo ordenamiento.
+def kruskal_suite(graph, positions, options):
+    yield 'min', measure(graph.kruskal, lambda: (True,), options.repeat)
+    yield 'max', measure(graph.kruskal, lambda: (False,), options.repeat)
+    yield 'min-lazy', measure(graph.kruskal, lambda: (True, 'lazy'), options.repeat)
+    yield 'max-lazy', measure(graph.kruskal, lambda: (False, 'lazy'), options.repeat)
+    yield 'both', measure(graph.kruskal_both, repeat=options.repeat)
+
+#Mediciones de escalado de los motores paralelos según el número de procesos.
+def scaling_suite(graph, positions, options):
+    for engine in ('boruvka', 'filter-kruskal'):
+        for workers in options.workers:
+            yield f'{engine}/{workers}', measure(graph.kruskal, lambda: (True, engine, workers), options.repeat)
+
+#Mediciones de dibujo sin ventanas: disposición automática (si el generador no da posiciones)
+#y render_trees a PNG con una muestra de las aristas de fondo.
+def draw_suite(graph, positions, options):
+    tree = graph.kruskal(True)
+    with tempfile.TemporaryDirectory() as directory:
+        def render():
+            graph.render_trees({'min': tree}, directory, positions=positions or graph.layout(tree_edges=tree), max_edges=options.draw_edges, edge_labels=None, node_labels=False)
+        yield 'render', measure(render, repeat=options.repeat)
+
+#Función para medir los bytes por arista que retiene lo que construye build (con tracemalloc).
+def retained_bytes(build, edge_count):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    value = retained / max(1, edge_count)
+    return {'min': value, 'median': value, 'mean': value, 'stdev': 0.0, 'runs': [value], 'unit': 'bytes/edge'}
+
+#Mediciones de memoria en bytes por arista: la representación original de los scripts (un
+#conjunto de nodos y una lista de tuplas con etiquetas de texto) frente a Graph (tabla de
+#etiquetas y columnas array('i')/array('d')), dirigido y no dirigido. En todos los casos las
+#etiquetas se crean dentro de la medición, así que su costo por nodo también se reparte.
+def memory_suite(graph, positions, options):
+    node_count = len(graph.labels)
+    src_ids = np.frombuffer(graph.src, dtype=np.intc).copy()
+    dst_ids = np.frombuffer(graph.dst, dtype=np.intc).copy()
+    weights = np.frombuffer(graph.weights, dtype=np.float64).copy()
+
+    def tuples():
+        names = [f'n{node_id}' for node_id in range(node_count)]
+        edges = [(names[u], names[v], w) for u, v, w in zip(src_ids.tolist(), dst_ids.tolist(), weights.tolist())]
+        return set(names), edges
+
+    def columns(undirected):
+        built = Graph(undirected)
+        for node_id in range(node_count):
+            built.add_node(f'n{node_id}')
+        built.append_edges(src_ids, dst_ids, weights)
+        return built
+
+    yield 'tuples', retained_bytes(tuples, len(weights))
+    yield 'graph', retained_bytes(lambda: columns(False), len(weights))
+    yield 'graph-undirected', retained_bytes(lambda: columns(True), len(weights))
+
+#Mediciones de un barrido de doce escenarios sobre la misma topología (cuatro escalas de los
+#pesos, cuatro umbrales y cuatro cambios del 1 % de las aristas): 'resort' ordena las aristas en
+#cada escenario, como kruskal, e 'index' reutiliza un ScenarioIndex creado una vez.
+def scenarios_suite(graph, positions, options):
+    index = graph.scenario_index()
+    weights = index.weights
+    first = 2 * len(graph.labels)
+    rng = np.random.default_rng(options.seed)
+    limits = np.quantile(weights, [0.25, 0.5, 0.75, 1.0]).tolist() if len(weights) else []
+    changed = rng.choice(len(weights), size=max(1, len(weights) // 100), replace=False) if len(weights) else np.zeros(0, dtype=np.intp)
+    updates = [rng.random(len(changed)) for _ in range(4)]
+
+    def resort():
+        for factor in (0.5, 1.0, 2.0, 4.0):
+            graph.scan_edges(chunked(np.argsort(weights * factor, kind='stable'), first))
+        for limit in limits:
+            kept = np.flatnonzero(weights <= limit)
+            graph.scan_edges(chunked(kept[np.argsort(weights[kept], kind='stable')], first))
+        for update in updates:
+            changed_weights = weights.copy()
+            changed_weights[changed] = update
+            graph.scan_edges(chunked(np.argsort(changed_weights, kind='stable'), first))
+
+    def reuse():
+        for factor in (0.5, 1.0, 2.0, 4.0):
+            index.select('min', lambda values: values * factor)
+        for limit in limits:
+            index.select('min', max_weight=limit)
+        for update in updates:
+            index.reweight(update, changed).select('min')
+
+    yield 'resort', measure(resort, repeat=options.repeat)
+    yield 'index', measure(reuse, repeat=options.repeat)
+
+#Función para escribir una medición con su unidad (segundos si no se indica otra).
+def format_value(value, unit='seconds'):
+    if unit == 'seconds':
+        return f'{value * 1000:10.3f} ms'
+    return f'{value:10.1f} {unit}'
+
+SUITES = {
+    'sort': sort_suite,
+    'union-find': union_find_suite,
+    'kruskal': kruskal_suite,
+    'scaling': scaling_suite,
+    'draw': draw_suite,
+    'memory': memory_suite,
+    'scenarios': scenarios_suite,
+}
+
+#Función para cargar el build_map de un script de ejemplo sin ejecutar su main.
+def load_fixture(filename):
+    path = Path(__file__).resolve().parent.parent / filename
+    if not path.exists():
+        return None
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.build_map
+
+#Función para generar un grafo pequeño al azar (puede tener aristas paralelas, lazos, empates y
+#nodos aislados) para las comprobaciones contra fuerza bruta.
+def small_graph(rng, max_nodes=8, max_edges=14, ties=False):
+    node_count = int(rng.integers(1, max_nodes + 1))
+    edge_count = int(rng.integers(0, max_edges + 1))
+    graph = Graph()
+    for node in range(node_count):
+        graph.add_node(node)
+    weights = rng.integers(1, 4, size=edge_count).astype(np.float64) if ties else rng.random(edge_count).round(2)
+    graph.add_edges(rng.integers(node_count, size=edge_count), rng.integers(node_count, size=edge_count), weights)
+    return graph
+
+#Comprobación de BottleneckIndex: el cuello de botella entre dos nodos es el menor umbral (mayor
+#en modo 'max') con el que quedan conectados usando solo aristas de peso hasta ese umbral.
+def check_bottleneck(rng):
+    problems = []
+    for trial in range(200):
+        graph = small_graph(rng, ties=trial % 2 == 1)
+        edges = list(zip(graph.src, graph.dst, graph.weights))
+        node_count = len(graph.labels)
+        for mode in ('min', 'max'):
+            index = graph.bottleneck_index(mode)
+            thresholds = sorted({w for _, _, w in edges}, reverse=mode == 'max')
+            for u in range(node_count):
+                for v in range(node_count):
+                    expected = math.nan
+                    if u == v:
+                        expected = -math.inf if mode == 'min' else math.inf
+                    else:
+                        for threshold in thresholds:
+                            sets = DisjointSet(node_count)
+                            for a, b, w in edges:
+                                if (w <= threshold if mode == 'min' else w >= threshold):
+                                    sets.union(a, b)
+                            if sets.find(u) == sets.find(v):
+                                expected = threshold
+                                break
+                    got = index.query(u, v)
+                    if not (got == expected or (math.isnan(got) and math.isnan(expected))):
+                        problems.append(f'{mode} prueba {trial}: {u}-{v} da {got}, se esperaba {expected}')
+    return problems
+
+#Comprobación de Graph.from_points: con las aristas candidatas, el árbol mínimo y el máximo
+#pesan lo mismo que con todas las parejas de puntos. Incluye puntos repetidos, alineados
+#(sobre una cuadrícula entera) y en 1, 2 y 3 dimensiones. En 2D, con Delaunay, además las
+#candidatas del árbol mínimo deben ser O(V) (a lo más 3 por punto) y no el grafo completo.
+def check_geometry(rng):
+    problems = []
+    methods = ['auto', 'delaunay'] if importlib.util.find_spec('scipy') else ['auto']
+    for trial in range(150):
+        dimensions = (2, 2, 3, 1)[trial % 4]
+        count = int(rng.integers(1, 40))
+        if trial % 3 == 0:
+            points = rng.integers(0, 4, size=(count, dimensions)).astype(np.float64)
+        else:
+            points = rng.random((count, dimensions))
+        first, second = np.triu_indices(count, 1)
+        complete = Graph()
+        for node in range(count):
+            complete.add_node(node)
+        complete.append_edges(first, second, np.linalg.norm(points[first] - points[second], axis=1))
+        if 'delaunay' in methods and dimensions == 2 and len(candidate_edges(points, 'min', 'delaunay')[0]) > 3 * count:
+            problems.append(f'delaunay prueba {trial}: más de {3 * count} candidatas para {count} puntos')
+        for mode in ('min', 'max'):
+            expected = sum(edge[2] for edge in complete.kruskal(mode == 'min'))
+            for method in methods:
+                tree = Graph.from_points(points, mode, method).kruskal(mode == 'min')
+                weight = sum(edge[2] for edge in tree)
+                if not math.isclose(weight, expected, rel_tol=1e-9, abs_tol=1e-9) or len(tree) != max(count - 1, 0):
+                    problems.append(f'{mode}/{method} prueba {trial} ({count} puntos en {dimensions}D): peso {weight}, se esperaba {expected}')
+    return problems
+
+#Función para el árbol de referencia de un escenario: kruskal sobre un grafo nuevo con los mismos
+#nodos y solo las aristas de keep, con los pesos del escenario.
+def scenario_reference(graph, weights, mode, keep=None):
+    rebuilt = Graph()
+    for label in graph.labels:
+        rebuilt.add_node(label)
+    kept = np.flatnonzero(np.ones(len(weights), dtype=bool) if keep is None else keep)
+    if len(kept):
+        rebuilt.append_edges(np.frombuffer(graph.src, dtype=np.intc)[kept], np.frombuffer(graph.dst, dtype=np.intc)[kept], weights[kept])
+    return repr(rebuilt.kruskal(mode == 'min'))
+
+#Comprobación de ScenarioIndex: con transformaciones monótonas, umbrales, máscaras y reweight
+#(con posiciones o con el arreglo completo), los árboles son los de kruskal sobre el grafo con
+#los pesos del escenario, y el orden de reweight es el de un argsort estable (también con NaN).
+#total coincide con el peso del árbol y, si el grafo cambia, el índice se niega a responder.
+def check_scenarios(rng):
+    problems = []
+    transforms = [(lambda x: 2 * x + 1, False), (lambda x: np.floor(x * 2), False), (lambda x: -x, True), (lambda x: np.round(-x * 3), True)]
+    for trial in range(100):
+        graph = small_graph(rng, 12, 40, trial % 2 == 1)
+        weights = np.frombuffer(graph.weights, dtype=np.float64).copy()
+        index = graph.scenario_index()
+        threshold = 1.5 if trial % 2 else 0.5
+        keep = rng.random(len(weights)) < 0.6
+        for mode in ('min', 'max'):
+            cases = [('base', index.tree(mode), scenario_reference(graph, weights, mode))]
+            for number, (transform, decreasing) in enumerate(transforms):
+                cases.append((f'transform {number}', index.tree(mode, transform, decreasing), scenario_reference(graph, transform(weights), mode)))
+            cases.append(('max_weight', index.tree(mode, max_weight=threshold), scenario_reference(graph, weights, mode, weights <= threshold)))
+            cases.append(('min_weight', index.tree(mode, min_weight=threshold), scenario_reference(graph, weights, mode, weights >= threshold)))
+            cases.append(('keep', index.tree(mode, keep=keep), scenario_reference(graph, weights, mode, keep)))
+            for fraction in (0.1, 0.9):
+                changed = rng.random(len(weights)) < fraction
+                new = weights.copy()
+                new[changed] = rng.integers(1, 4, size=int(changed.sum())) if trial % 2 else rng.random(int(changed.sum()))
+                positions = np.flatnonzero(changed)
+                if trial % 5 == 0 and len(positions): #Algunos pesos NaN, que van al final del orden.
+                    new[positions[0]] = np.nan
+                for name, reweighted in (('reweight', index.reweight(new)), ('reweight posiciones', index.reweight(new[positions], positions))):
+                    if not np.array_equal(reweighted.order, np.argsort(new, kind='stable')):
+                        problems.append(f'{name} {fraction} prueba {trial}: el orden no es el de argsort estable')
+                    cases.append((f'{name} {fraction}', reweighted.tree(mode), scenario_reference(graph, new, mode)))
+            for name, got, expected in cases:
+                if repr(got) != expected:
+                    problems.append(f'{mode}/{name} prueba {trial}: {got!r}, se esperaba {expected}')
+            weight = math.fsum(edge[2] for edge in index.tree(mode))
+            if not math.isclose(index.total(mode), weight, abs_tol=1e-9):
+                problems.append(f'{mode}/total prueba {trial}: {index.total(mode)}, se esperaba {weight}')
+        graph.add_edge(0, 0, 1.0)
+        try:
+            index.tree()
+            problems.append(f'prueba {trial}: el índice respondió después de cambiar el grafo')
+        except ValueError:
+            pass
+    return problems
+
+#Comprobación de k_best_spanning_trees y count_best_spanning_trees: se prueban todas las
+#combinaciones de aristas del tamaño de un bosque de expansión, y los árboles (con sus costos en
+#orden) deben ser los mismos, el primero el de kruskal, y el conteo el de los empatados con el mejor.
+#Con tolerance se entregan justo los árboles cuyo costo está a esa distancia del mejor.
+def check_kbest(rng):
+    problems = []
+    for trial in range(150):
+        graph = small_graph(rng, 6, 9, trial % 2 == 1)
+        node_count = len(graph.labels)
+        src, dst, weights = list(graph.src), list(graph.dst), list(graph.weights)
+        sets = DisjointSet(node_count)
+        size = sum(sets.union(u, v) for u, v in zip(src, dst)) #Aristas de un bosque de expansión.
+        forests = []
+        for edges in itertools.combinations(range(len(weights)), size):
+            sets = DisjointSet(node_count)
+            if all(sets.union(src[edge], dst[edge]) for edge in edges):
+                forests.append((math.fsum(weights[edge] for edge in edges), sorted(graph.edge_tuples(list(edges)))))
+        for mode in ('min', 'max'):
+            expected = sorted(forests, key=lambda forest: (round(forest[0], 9), forest[1]), reverse=mode == 'max')
+            trees = graph.k_best_spanning_trees(len(forests) + 1, mode)
+            got = sorted(((round(total, 9), sorted(tree)) for total, tree in trees), reverse=mode == 'max')
+            if len(trees) != len(expected) or [tree for _, tree in got] != [tree for _, tree in expected]:
+                problems.append(f'{mode} prueba {trial}: {len(trees)} árboles, se esperaban {len(expected)} (o no son los mismos)')
+                continue
+            if not all(math.isclose(a[0], b[0], abs_tol=1e-9) for a, b in zip(trees, expected)):
+                problems.append(f'{mode} prueba {trial}: costos {[total for total, _ in trees]}, se esperaba {[total for total, _ in expected]}')
+            if trees[0][1] != graph.kruskal(mode == 'min'):
+                problems.append(f'{mode} prueba {trial}: el primer árbol no es el de kruskal')
+            best = sum(1 for total, _ in expected if math.isclose(total, expected[0][0], abs_tol=1e-9))
+            if graph.count_best_spanning_trees(mode) != best:
+                problems.append(f'{mode} prueba {trial}: {graph.count_best_spanning_trees(mode)} árboles óptimos, se esperaban {best}')
+            tolerance = 0 if trial % 2 else 0.255 #Los pesos son enteros o de dos decimales: sin totales en el borde.
+            near = sum(1 for total, _ in expected if abs(total - expected[0][0]) <= tolerance)
+            if len(graph.k_best_spanning_trees(len(forests) + 1, mode, tolerance)) != near:
+                problems.append(f'{mode} prueba {trial}: con tolerancia {tolerance} se esperaban {near} árboles')
+    return problems
+
+#Comprobaciones contra fuerza bruta en grafos pequeños al azar (con semilla fija), para que un
+#cambio en los algoritmos más delicados no pase desapercibido. Viven aquí porque el paquete no
+#tiene otra batería de pruebas: check_fixtures corre antes de cada medición (y solo, con
+#--fixtures-only), así que un resultado incorrecto no llega a compararse por velocidad.
+CHECKS = {
+    'bottleneck': check_bottleneck,
+    'geometry': check_geometry,
+    'scenarios': check_scenarios,
+    'kbest': check_kbest,
+}
+
+#Función para comprobar los mapas de ejemplo: pesos esperados, árboles con todas las aristas
+#necesarias y el mismo resultado con cada motor y con kruskal_both.
+def check_fixtures():
+    results = []
+    for name, (filename, minimum, maximum) in FIXTURES.items():
+        build_map = load_fixture(filename)
+        if build_map is None:
+            results.append({'name': name, 'ok': None, 'problems': [f'{filename} no encontrado']})
+            continue
+        graph = build_map()
+        problems = []
+        both = dict(zip(('min', 'max'), graph.kruskal_both()))
+        for mode, expected in (('min', minimum), ('max', maximum)):
+            for engine in ENGINES:
+                tree = graph.kruskal(mode == 'min', engine, 2)
+                weight = sum(edge[2] for edge in tree)
+                if not math.isclose(weight, expected):
+                    problems.append(f'{mode}/{engine}: peso {weight}, se esperaba {expected}')
+                if len(tree) != len(graph.labels) - 1:
+                    problems.append(f'{mode}/{engine}: {len(tree)} aristas para {len(graph.labels)} nodos')
+            if both[mode] != graph.kruskal(mode == 'min'):
+                problems.append(f'{mode}: kruskal_both no coincide con kruskal')
+        results.append({'name': name, 'ok': not problems, 'problems': problems})
+    for name, check in CHECKS.items():
+        problems = check(np.random.default_rng(0))
+        results.append({'name': name, 'ok': not problems, 'problems': problems[:5]})
+    return results
+
+#Función para ejecutar las mediciones pedidas. Devuelve {nombre: resumen}, donde el nombre es
+#suite/generador/aristas/caso.
+def run_benchmarks(options, log=None):
+    benchmarks = {}
+    for kind in options.generators:
+        for size in options.sizes:
+            graph, positions = generate(kind, size, options.seed)
+            for suite in options.suites:
+                for case, summary in SUITES[suite](graph, positions, options):
+                    name = f'{suite}/{kind}/{size}/{case}'
+                    summary['edges'] = len(graph.weights)
+                    summary['nodes'] = len(graph.labels)
+                    benchmarks[name] = summary
+                    if log is not None:
+                        print(f'{name}: {format_value(summary["median"], summary.get("unit", "seconds")).strip()}', file=log)
+    return benchmarks
+
+#Función para comparar dos resultados por la mediana de cada medición común. Devuelve filas
+#(nombre, mediana base, mediana actual, cambio relativo, es_regresión, unidad).
+def compare(current, baseline, threshold=0.10):
+    rows = []
+    for name, summary in current['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None or previous['median'] <= 0:
+            continue
+        change = summary['median'] / previous['median'] - 1
+        rows.append((name, previous['median'], summary['median'], change, change > threshold, summary.get('unit', 'seconds')))
+    return rows
+
+#Función para escribir la tabla de comparación.
+def report(rows, file=sys.stdout):
+    for name, before, after, change, regression, unit in rows:
+        mark = 'REGRESIÓN' if regression else ''
+        print(f'{name:60} {format_value(before, unit)} -> {format_value(after, unit)} {change:+8.1%} {mark}', file=file)
+
+#Función para leer y validar las opciones de la línea de comandos.
+def parse_args(argv=None):
+    cpus = os.cpu_count() or 1
+    default_workers = [workers for workers in (1, 2, 4, 8, 16, 32, 64) if workers <= cpus] #Hasta un proceso por núcleo.
+    parser = argparse.ArgumentParser(prog='python -m kruskal.benchmark', description='Mide el rendimiento de Kruskal sobre grafos sintéticos y compara contra una línea base.')
+    parser.add_argument('--suites', nargs='+', choices=list(SUITES), default=['sort', 'union-find', 'kruskal'], help='Mediciones a ejecutar (scaling, draw, memory y scenarios solo si se piden).')
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), default=list(GENERATORS), help='Tipos de grafo sintético.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000], help='Número aproximado de aristas de cada grafo.')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla de los generadores.')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones medidas de cada caso.')
+    parser.add_argument('--workers', nargs='+', type=int, default=default_workers, help='Procesos para la medición de escalado.')
+    parser.add_argument('--draw-edges', type=int, default=5000, help='Aristas de fondo dibujadas en la medición de dibujo.')
+    parser.add_argument('--output', help='Archivo JSON donde guardar los resultados.')
+    parser.add_argument('--baseline', help='Resultados JSON anteriores contra los que comparar.')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Aumento relativo de la mediana que cuenta como regresión.')
+    parser.add_argument('--load', help='Compara este archivo de resultados contra --baseline sin medir nada.')
+    parser.add_argument('--fixtures-only', action='store_true', help='Solo comprueba los mapas de ejemplo.')
+    args = parser.parse_args(argv)
+    if args.load and not args.baseline:
+        parser.error('--load necesita --baseline')
+    if args.repeat < 1:
+        parser.error('--repeat debe ser al menos 1')
+    return args
+
+#Función principal. Devuelve 1 si algún mapa de ejemplo falla o si hay regresiones, 0 si no.
+def main(argv=None):
+    args = parse_args(argv)
+    if args.load:
+        with open(args.load) as file:
+            results = json.load(file)
+    else:
+        results = {
+            'meta': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'seed': args.seed,
+                'repeat': args.repeat,
+            },
+            'fixtures': check_fixtures(),
+            'benchmarks': {} if args.fixtures_only else run_benchmarks(args, sys.stderr),
+        }
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=2)
+
+    failed = False
+    for fixture in results.get('fixtures', []):
+        if fixture['ok'] is False:
+            failed = True
+        status = {True: 'ok', False: 'FALLA', None: 'omitido'}[fixture['ok']]
+        print(f"{fixture['name']}: {status}", *fixture['problems'], sep='\n  ' if fixture['problems'] else '')
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        rows = compare(results, baseline, args.threshold)
+        report(rows)
+        failed = failed or any(row[4] for row in rows)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#Índice de cuellos de botella: árbol de reconstrucción de Kruskal con saltos binarios (LCA).
+
+import numpy as np #Importamos numpy para las tablas de saltos y las consultas por lotes.
+
+from .disjoint_set import DisjointSet
+
+#Definimos la clase BottleneckIndex. Se construye con las aristas aceptadas en orden de Kruskal:
+#cada unión crea un nodo interno cuyo peso es el de la arista y cuyos hijos son los dos árboles
+#que une (árbol de reconstrucción de Kruskal). El peso del ancestro común más bajo de u y v es
+#el cuello de botella entre ellos: en modo 'min' el máximo peso del camino en el árbol mínimo
+#(minimax) y en modo 'max' el mínimo peso del camino en el árbol máximo (maximin). El ancestro
+#se encuentra con saltos binarios en O(log V) por consulta. Nodos de componentes distintas dan
+#NaN y un nodo consigo mismo da -inf en modo 'min' y +inf en modo 'max' (camino vacío).
+class BottleneckIndex:
+    def __init__(self, graph, mode, edges):
+        self.mode = mode #'min' o 'max'.
+        self.ids = graph.ids #Etiqueta -> id, para las consultas por etiqueta.
+        node_count = len(graph.labels)
+        edges = np.asarray(edges, dtype=np.intp)
+        src = np.frombuffer(graph.src, dtype=np.intc)[edges].tolist()
+        dst = np.frombuffer(graph.dst, dtype=np.intc)[edges].tolist()
+        total = node_count + len(src) #Hojas (los nodos) más un nodo interno por arista del árbol.
+        parent = np.arange(total, dtype=np.intp)
+        self.weights = np.full(total, np.nan) #Peso de cada nodo interno (las hojas no tienen).
+        self.weights[node_count:] = np.frombuffer(graph.weights, dtype=np.float64)[edges]
+
+        #Repetimos las uniones de Kruskal; top[r] es el nodo del árbol que hoy representa al conjunto r.
+        sets = DisjointSet(node_count)
+        top = list(range(node_count))
+        for k, (u, v) in enumerate(zip(src, dst)):
+            u_root, v_root = sets.find(u), sets.find(v)
+            node = node_count + k
+            parent[top[u_root]] = node
+            parent[top[v_root]] = node
+            sets.union(u_root, v_root)
+            top[sets.find(u_root)] = node
+
+        #Profundidad de cada nodo con saltos de puntero: O(V log profundidad), vectorizado.
+        depth = (parent != np.arange(total)).astype(np.intp)
+        jump = parent
+        while True:
+            next_jump = jump[jump]
+            if np.array_equal(next_jump, jump):
+                break
+            depth += depth[jump] #La distancia hasta el destino del salto más la que le falta a ese destino.
+            jump = next_jump
+        self.depth = depth
+
+        #Tabla de saltos: up[j][x] es el ancestro 2**j niveles arriba de x (o la raíz).
+        self.up = [parent]
+        for _ in range(max(1, int(depth.max(initial=0)).bit_length()) - 1):
+            self.up.append(self.up[-1][self.up[-1]])
+
+    #Método para consultar por lotes con arreglos de ids. Devuelve un arreglo de pesos.
+    def query_ids(self, u, v):
+        u = np.asarray(u, dtype=np.intp).copy()
+        v = np.asarray(v, dtype=np.intp).copy()
+        same_node = u == v
+        swap = self.depth[u] < self.depth[v] #Dejamos en u el más profundo.
+        u[swap], v[swap] = v[swap], u[swap]
+        difference = self.depth[u] - self.depth[v]
+        for level, up in enumerate(self.up): #Subimos u hasta la profundidad de v.
+            u = np.where((difference >> level) & 1 == 1, up[u], u)
+        same = u == v
+        for up in reversed(self.up): #Subimos ambos mientras sus ancestros sean distintos.
+            u_up, v_up = up[u], up[v]
+            move = u_up != v_up
+            u = np.where(move, u_up, u)
+            v = np.where(move, v_up, v)
+        parent = self.up[0]
+        ancestor = np.where(same, u, parent[u])
+        connected = same | (parent[u] == parent[v]) & (parent[u] != u)
+        result = np.where(connected, self.weights[ancestor], np.nan)
+        result[same_node] = -np.inf if self.mode == 'min' else np.inf
+        return result
+
+    #Método para consultar por lotes con listas de etiquetas.
+    def query_many(self, from_nodes, to_nodes):
+        ids = self.ids
+        return self.query_ids([ids[label] for label in from_nodes], [ids[label] for label in to_nodes])
+
+    #Método para consultar el cuello de botella entre dos nodos.
+    def query(self, from_node, to_node):
+        return float(self.query_many([from_node], [to_node])[0])
@@ -0,0 +1,81 @@
+#Caché LRU de árboles de expansión, con límites de entradas y de bytes y copia opcional en disco.
+
+import hashlib #Importamos hashlib para nombrar los archivos de la caché en disco.
+import os #Importamos os para crear la carpeta de la caché y renombrar archivos.
+import pickle #Importamos pickle para medir y guardar en disco los árboles de la caché.
+from collections import OrderedDict #Importamos OrderedDict para la caché LRU.
+
+#Definimos la clase TreeCache, una caché LRU para árboles de expansión ya calculados.
+#Se limita por número de entradas y por bytes (tamaño serializado de cada árbol); con
+#directory, cada resultado también se guarda en disco y sobrevive a la caché en memoria.
+class TreeCache:
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024, directory=None):
+        self.max_entries = max_entries #Número máximo de árboles en memoria.
+        self.max_bytes = max_bytes #Tamaño máximo (en bytes serializados) de los árboles en memoria.
+        self.directory = directory #Carpeta opcional para guardar los resultados en disco.
+        self.entries = OrderedDict() #Clave -> (árbol, bytes); el más reciente va al final.
+        self.bytes = 0 #Bytes ocupados por los árboles en memoria.
+        self.hits = 0 #Consultas respondidas desde memoria.
+        self.disk_hits = 0 #Consultas respondidas desde disco.
+        self.misses = 0 #Consultas que hubo que calcular.
+        self.evictions = 0 #Árboles expulsados de memoria por los límites.
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    #Método para buscar un árbol; devuelve None si no está en memoria ni en disco.
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key) #Lo marcamos como el más reciente.
+            self.hits += 1
+            return list(entry[0])
+        if self.directory is not None:
+            try:
+                with open(self.path(key), 'rb') as file:
+                    tree = pickle.load(file)
+            except FileNotFoundError:
+                pass
+            else:
+                self.disk_hits += 1
+                self.remember(key, tree)
+                return list(tree)
+        self.misses += 1
+        return None
+
+    #Método para guardar un árbol recién calculado.
+    def put(self, key, tree):
+        tree = list(tree)
+        if self.directory is not None: #Escribimos en un archivo temporal y lo renombramos para no dejar archivos a medias.
+            path = self.path(key)
+            with open(path + '.tmp', 'wb') as file:
+                pickle.dump(tree, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + '.tmp', path)
+        self.remember(key, tree)
+
+    #Método para guardar un árbol en memoria y expulsar los menos recientes si se pasan los límites.
+    def remember(self, key, tree):
+        size = len(pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+        if size > self.max_bytes: #No cabe ni solo; se queda únicamente en disco (si hay).
+            return
+        self.entries[key] = (tree, size)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False) #Expulsamos el menos reciente.
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    #Método para obtener la ruta en disco de una clave.
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest() + '.pkl')
+
+    #Método para vaciar la caché en memoria (los archivos en disco se conservan).
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    #Método para obtener los contadores de la caché.
+    def stats(self):
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'evictions': self.evictions, 'entries': len(self.entries), 'bytes': self.bytes}
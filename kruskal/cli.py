@@ -0,0 +1,180 @@
+#Ejecutor por línea de comandos: lee listas de aristas desde archivos o la entrada estándar
+#(CSV, TSV, NDJSON, registros binarios EDGE_RECORD o el formato de Graph.save) y escribe un
+#resultado NDJSON por grafo. Uso: python -m kruskal [opciones] archivo ... (- = entrada estándar).
+
+import argparse #Importamos argparse para leer las opciones de la línea de comandos.
+import io #Importamos io para leer la entrada estándar como texto.
+import json #Importamos json para escribir los resultados en NDJSON.
+import struct #Importamos struct para reconocer archivos binarios truncados.
+import sys #Importamos sys para la entrada y salida estándar.
+import time #Importamos time para medir los tiempos de --stats.
+
+import numpy as np #Importamos numpy para leer los registros binarios de aristas.
+
+from .formats import EDGE_DTYPE, GRAPH_MAGIC
+from .graph import Graph
+from .profiling import Profiler
+from .streaming import read_ndjson_edges, read_text_edges
+
+FORMATS = ('auto', 'csv', 'tsv', 'ndjson', 'bin', 'graph') #Formatos de entrada aceptados.
+MODES = {'min': ('min',), 'max': ('max',), 'both': ('min', 'max')} #Valor de --mode -> árboles a calcular.
+#Extensión -> formato, para --format auto.
+EXTENSIONS = {'.csv': 'csv', '.tsv': 'tsv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.bin': 'bin'}
+
+#Función para adivinar el formato de una entrada por su firma, su extensión o su primera línea.
+def detect_format(name, head):
+    if head.startswith(GRAPH_MAGIC):
+        return 'graph'
+    for extension, input_format in EXTENSIONS.items():
+        if name.endswith(extension):
+            return input_format
+    first_line = head.split(b'\n', 1)[0]
+    if first_line.lstrip().startswith((b'{', b'[')):
+        return 'ndjson'
+    return 'tsv' if b'\t' in first_line else 'csv'
+
+#Función para construir el grafo de una entrada. data es None para archivos (se leen desde
+#disco; el formato graph se abre con mmap) o los bytes ya leídos de la entrada estándar.
+def load_graph(name, data, input_format, undirected, conflict):
+    if data is None:
+        with open(name, 'rb') as file:
+            head = file.read(4096)
+    else:
+        head = data[:4096]
+    if input_format == 'auto':
+        input_format = detect_format(name, head)
+
+    if input_format == 'graph':
+        if data is not None:
+            raise ValueError('El formato graph se abre con mmap y necesita un archivo, no la entrada estándar')
+        return Graph.load(name, conflict) #El archivo ya indica si el grafo es no dirigido.
+
+    if input_format == 'bin':
+        if data is None:
+            with open(name, 'rb') as file:
+                data = file.read()
+        if len(data) % EDGE_DTYPE.itemsize:
+            raise ValueError(f'{name}: el tamaño no es múltiplo de un registro de arista ({EDGE_DTYPE.itemsize} bytes)')
+        records = np.frombuffer(data, dtype=EDGE_DTYPE)
+        graph = Graph(undirected, conflict)
+        graph.add_edges(records['src'], records['dst'], records['weight'])
+        return graph
+
+    if data is None:
+        file = open(name, newline='', encoding='utf-8')
+    else:
+        file = io.StringIO(data.decode('utf-8'), newline='')
+    with file:
+        if input_format == 'ndjson':
+            edges = read_ndjson_edges(file)
+        else:
+            edges = read_text_edges(file, '\t' if input_format == 'tsv' else ',')
+        return Graph.from_edges(edges, undirected, conflict)
+
+#Función para describir los árboles de un grafo como diccionario listo para JSON: número de
+#nodos y aristas y, por cada modo, el peso total y las aristas del árbol.
+def tree_results(graph, trees, modes):
+    result = {'nodes': len(graph.labels), 'edges': len(graph.weights)}
+    for mode in modes:
+        tree = trees[mode]
+        result[mode] = {'weight': sum(weight for _, _, weight in tree), 'edges': tree}
+    return result
+
+#Función que resuelve una entrada y devuelve su resultado como diccionario listo para JSON.
+#Los errores de una entrada se informan en su resultado para no detener el resto del lote.
+def solve(job):
+    name, data, input_format, modes, undirected, conflict, stats = job
+    result = {'input': name}
+    started = time.perf_counter()
+    try:
+        graph = load_graph(name, data, input_format, undirected, conflict)
+        if stats:
+            graph.profiler = Profiler() #Fases y contadores de union-find para --stats.
+        loaded = time.perf_counter()
+        trees = graph.spanning_trees(modes)
+        solved = time.perf_counter()
+    except (OSError, ValueError, TypeError, struct.error) as error: #TypeError: etiquetas o pesos de tipos inesperados.
+        result['error'] = str(error)
+        return result
+
+    result.update(tree_results(graph, trees, modes))
+    if stats:
+        result['stats'] = {'load_seconds': round(loaded - started, 6), 'solve_seconds': round(solved - loaded, 6),
+                           'kruskal': graph.profiler.last.as_dict()}
+    return result
+
+#Función generadora con los nombres de entrada: los argumentos y, con --files-from, un nombre por línea.
+def input_names(args):
+    yield from args.inputs
+    if args.files_from is not None:
+        file = sys.stdin if args.files_from == '-' else open(args.files_from)
+        with file:
+            for line in file:
+                if line.strip():
+                    yield line.strip()
+
+#Función para leer y validar las opciones de la línea de comandos.
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kruskal', description='Calcula árboles de expansión mínima/máxima de muchos grafos y escribe un resultado NDJSON por grafo.')
+    parser.add_argument('inputs', nargs='*', help="Archivos de aristas; '-' lee la entrada estándar (por defecto si no se da ninguno).")
+    parser.add_argument('--files-from', metavar='LISTA', help="Archivo con un nombre de entrada por línea ('-' = entrada estándar).")
+    parser.add_argument('--format', choices=FORMATS, default='auto', help='Formato de las entradas (por defecto se adivina).')
+    parser.add_argument('--mode', choices=list(MODES), default='both', help='Árboles a calcular.')
+    parser.add_argument('--workers', type=int, default=1, metavar='N', help='Procesos para resolver varias entradas en paralelo.')
+    parser.add_argument('--stats', action='store_true', help='Agrega tiempos por grafo y un resumen en stderr.')
+    parser.add_argument('--undirected', action='store_true', help='Trata cada arista como no dirigida y fusiona sus espejos.')
+    parser.add_argument('--conflict', choices=('min', 'max', 'raise'), default='min', help='Qué hacer con aristas repetidas en modo no dirigido.')
+    parser.add_argument('-o', '--output', default='-', help="Archivo de salida ('-' = salida estándar).")
+    args = parser.parse_args(argv)
+    if not args.inputs and args.files_from is None:
+        args.inputs = ['-']
+    if args.workers < 1:
+        parser.error('--workers debe ser al menos 1')
+    if args.files_from == '-' and '-' in args.inputs:
+        parser.error("La entrada estándar no puede ser a la vez una entrada y la lista de --files-from")
+    return args
+
+#Función principal: resuelve cada entrada en orden y escribe su línea NDJSON en cuanto está lista.
+#Devuelve el código de salida: 0 si todas las entradas se resolvieron y 1 si alguna falló.
+def main(argv=None):
+    args = parse_args(argv)
+    modes = MODES[args.mode]
+    stdin_data = None
+
+    def jobs():
+        nonlocal stdin_data
+        for name in input_names(args):
+            data = None
+            if name == '-':
+                if stdin_data is None:
+                    stdin_data = sys.stdin.buffer.read() #La entrada estándar solo se puede leer una vez.
+                data = stdin_data
+            yield name, data, args.format, modes, args.undirected, args.conflict, args.stats
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started = time.perf_counter()
+    graphs = errors = 0
+    pool = None
+    if args.workers > 1:
+        from multiprocessing import Pool #Solo se crean procesos si se piden varios.
+        pool = Pool(args.workers)
+    try:
+        #imap conserva el orden de las entradas y entrega cada resultado en cuanto está listo.
+        results = pool.imap(solve, jobs()) if pool is not None else map(solve, jobs())
+        for result in results:
+            graphs += 1
+            errors += 'error' in result
+            output.write(json.dumps(result, ensure_ascii=False) + '\n')
+            output.flush() #Para que el siguiente programa de la tubería no espere al lote completo.
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if output is not sys.stdout:
+            output.close()
+
+    if args.stats:
+        elapsed = time.perf_counter() - started
+        rate = graphs / elapsed if elapsed else 0.0
+        print(f'{graphs} grafos ({errors} con error) en {elapsed:.3f} s: {rate:.1f} grafos/s', file=sys.stderr)
+    return 1 if errors else 0
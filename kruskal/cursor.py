@@ -0,0 +1,70 @@
+#Recorrido progresivo de Kruskal: entrega cada arista del árbol en cuanto se acepta y se puede
+#pausar, guardar (pickle) y reanudar más tarde desde el mismo punto.
+
+import numpy as np #Importamos numpy para ordenar y reunir las aristas por bloques.
+
+from .disjoint_set import DisjointSet
+from .sorting import check_mode
+
+#Definimos la clase TreeCursor: un iterador sobre las aristas del árbol 'min' o 'max' de un grafo.
+#Cada paso entrega (origen, destino, peso, peso acumulado, componentes restantes). El cursor
+#guarda el orden de las aristas, la posición dentro de ese orden y el estado del union-find, así
+#que basta con dejar de iterar para cancelar y volver a iterar (aunque sea después de guardarlo
+#con pickle y cargarlo en otro proceso, con attach) para seguir donde se quedó.
+class TreeCursor:
+    def __init__(self, graph, mode='min', block=4096):
+        check_mode(mode)
+        self.mode = mode #Árbol que se recorre.
+        self.block = block #Aristas que se reúnen de una vez.
+        self.graph = graph #Grafo recorrido (no se guarda al serializar el cursor).
+        self.fingerprint = graph.fingerprint() #Huella para comprobar que se reanuda sobre el mismo grafo.
+        self.order = graph.sorted_order(mode == 'min') #Orden de las aristas por peso.
+        self.position = 0 #Siguiente posición del orden por revisar.
+        self.sets = DisjointSet(len(graph.labels)) #Estado del union-find.
+        self.components = len(graph.labels) #Componentes que quedan por unir.
+        self.total = 0.0 #Peso acumulado de las aristas aceptadas.
+        self.accepted = 0 #Aristas aceptadas hasta ahora.
+
+    #Propiedad que indica si ya no quedan aristas por entregar.
+    @property
+    def done(self):
+        return self.components <= 1 or self.position >= len(self.order)
+
+    #Método para volver a conectar un cursor cargado con pickle a su grafo.
+    def attach(self, graph):
+        if graph.fingerprint() != self.fingerprint:
+            raise ValueError('El grafo cambió desde que se creó el cursor; no se puede reanudar')
+        self.graph = graph
+        return self
+
+    #Al serializar se guarda todo menos el grafo, que se vuelve a conectar con attach.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['graph'] = None
+        return state
+
+    #Método generador que sigue el recorrido desde la posición guardada. La posición avanza
+    #antes de entregar cada arista, así que al reanudar no se repite ni se salta ninguna.
+    def __iter__(self):
+        if self.graph is None:
+            raise ValueError('El cursor no tiene grafo; use attach(graph) o graph.iter_spanning_tree(cursor=...)')
+        labels = self.graph.labels
+        src_column = np.frombuffer(self.graph.src, dtype=np.intc)
+        dst_column = np.frombuffer(self.graph.dst, dtype=np.intc)
+        weight_column = np.frombuffer(self.graph.weights, dtype=np.float64)
+        union = self.sets.union
+        while not self.done:
+            start = self.position
+            chunk = self.order[start:start + self.block]
+            src = src_column[chunk].tolist()
+            dst = dst_column[chunk].tolist()
+            weights = weight_column[chunk].tolist()
+            for k in range(len(src)):
+                self.position = start + k + 1
+                if union(src[k], dst[k]): #Los representantes eran diferentes: no hay ciclo.
+                    self.total += weights[k]
+                    self.components -= 1
+                    self.accepted += 1
+                    yield labels[src[k]], labels[dst[k]], weights[k], self.total, self.components
+                    if self.components <= 1: #El árbol ya cubre todos los nodos.
+                        return
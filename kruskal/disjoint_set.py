@@ -0,0 +1,67 @@
+#Conjuntos disjuntos (union-find) sobre identificadores enteros densos.
+
+from array import array #Importamos array para guardar padres y tamaños en arreglos compactos.
+
+#Definimos la clase DisjointSet que representa los conjuntos disjuntos (union-find).
+#Trabaja sobre identificadores enteros densos (0..n-1) y guarda los padres y
+#tamaños en arreglos compactos en lugar de diccionarios.
+class DisjointSet:
+    def __init__(self, size=0):
+        self.parent = array('i', range(size)) #Cada nodo es su propio padre inicialmente.
+        self.size = array('i', [1]) * size #Cada conjunto empieza con un solo nodo.
+
+    #Método para agregar un nuevo conjunto de un solo nodo y devolver su identificador.
+    def add(self):
+        node_id = len(self.parent) #El siguiente identificador libre.
+        self.parent.append(node_id)
+        self.size.append(1)
+        return node_id
+
+    #Método iterativo para encontrar el representante de un identificador.
+    def find(self, node_id):
+        parent = self.parent
+        while parent[node_id] != node_id: #Mientras el nodo no sea su propio padre.
+            parent[node_id] = parent[parent[node_id]] #División a la mitad: apuntamos al abuelo.
+            node_id = parent[node_id] #Avanzamos al abuelo.
+        return node_id #Devolvemos el representante.
+
+    #Método para unir dos conjuntos por tamaño; devuelve False si ya estaban unidos.
+    def union(self, x, y):
+        x_root = self.find(x) #Encontramos el representante del primer subconjunto.
+        y_root = self.find(y) #Encontramos el representante del segundo subconjunto.
+        if x_root == y_root: #Ya pertenecen al mismo conjunto.
+            return False
+        if self.size[x_root] < self.size[y_root]: #Colgamos el conjunto más pequeño del más grande.
+            x_root, y_root = y_root, x_root
+        self.parent[y_root] = x_root
+        self.size[x_root] += self.size[y_root] #Actualizamos el tamaño del nuevo conjunto.
+        return True
+
+#Definimos la clase CountingDisjointSet: los mismos conjuntos disjuntos, pero contando las
+#llamadas a find y union y los saltos recorridos. Solo se usa cuando el grafo tiene un Profiler.
+class CountingDisjointSet(DisjointSet):
+    def __init__(self, size=0):
+        super().__init__(size)
+        self.finds = 0 #Llamadas a find.
+        self.unions = 0 #Llamadas a union.
+        self.path_total = 0 #Saltos de padre recorridos por todos los find.
+        self.max_path = 0 #Camino más largo recorrido por un find.
+
+    #Método find con división a la mitad que además cuenta los saltos.
+    def find(self, node_id):
+        parent = self.parent
+        steps = 0
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+            steps += 1
+        self.finds += 1
+        self.path_total += steps
+        if steps > self.max_path:
+            self.max_path = steps
+        return node_id
+
+    #Método union que cuenta las llamadas (union usa el find de arriba).
+    def union(self, x, y):
+        self.unions += 1
+        return DisjointSet.union(self, x, y)
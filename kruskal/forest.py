@@ -0,0 +1,73 @@
+#Bosque de expansión con resultados por componente, para grafos no conexos.
+
+import numpy as np #Importamos numpy para agrupar nodos y aristas por componente.
+
+from .disjoint_set import DisjointSet
+
+#Definimos la clase SpanningForest: el resultado de Graph.spanning_forest. Todo se guarda en
+#arreglos agrupados estilo CSR para analizarlo de forma vectorizada:
+#  component[u]                  componente del nodo con id u (0..count-1, numeradas por su menor id)
+#  nodes[node_offsets[c]:node_offsets[c + 1]]  ids de los nodos de la componente c
+#  edges[edge_offsets[c]:edge_offsets[c + 1]]  índices (sobre src, dst y weights del grafo) de las
+#                                aristas del árbol de la componente c, en orden de Kruskal
+#  src, dst, weights             columnas de esas aristas, en el mismo orden que edges
+#  totals[c]                     peso total del árbol de la componente c
+#Los nodos sin aristas (por ejemplo, agregados con add_node) forman componentes sin aristas.
+class SpanningForest:
+    def __init__(self, graph, mode, edges, sets=None):
+        self.mode = mode #'min' o 'max'.
+        self.labels = graph.labels #Etiquetas del grafo, para traducir ids.
+        node_count = len(graph.labels)
+        edges = np.asarray(edges, dtype=np.intp)
+        src = np.frombuffer(graph.src, dtype=np.intc)[edges]
+        dst = np.frombuffer(graph.dst, dtype=np.intc)[edges]
+        if sets is None: #Los motores paralelos no exponen su union-find: lo rehacemos con las aristas del árbol.
+            sets = DisjointSet(node_count)
+            for u, v in zip(src.tolist(), dst.tolist()):
+                sets.union(u, v)
+
+        #Representante de cada nodo saltando de padre en abuelo hasta que nada cambie.
+        roots = np.frombuffer(sets.parent, dtype=np.intc).astype(np.intp)
+        while True:
+            grandparents = roots[roots]
+            if np.array_equal(grandparents, roots):
+                break
+            roots = grandparents
+
+        #Numeramos las componentes por el menor id de sus nodos.
+        _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.intp)
+        rank[np.argsort(first, kind='stable')] = np.arange(len(first))
+        self.component = rank[inverse.ravel()]
+        self.count = len(first) #Número de componentes.
+
+        #Agrupamos nodos y aristas por componente (estable: se conserva el orden de cada grupo).
+        self.nodes = np.argsort(self.component, kind='stable')
+        self.node_offsets = np.concatenate([[0], np.cumsum(np.bincount(self.component, minlength=self.count))])
+        edge_component = self.component[src]
+        grouped = np.argsort(edge_component, kind='stable')
+        edge_component = edge_component[grouped]
+        self.edges = edges[grouped]
+        self.src = src[grouped]
+        self.dst = dst[grouped]
+        self.weights = np.frombuffer(graph.weights, dtype=np.float64)[self.edges]
+        self.edge_offsets = np.concatenate([[0], np.cumsum(np.bincount(edge_component, minlength=self.count))])
+        self.totals = np.bincount(edge_component, weights=self.weights, minlength=self.count)
+
+    def __len__(self):
+        return self.count
+
+    #Método para obtener las etiquetas de los nodos de una componente.
+    def component_nodes(self, component):
+        labels = self.labels
+        return [labels[u] for u in self.nodes[self.node_offsets[component]:self.node_offsets[component + 1]].tolist()]
+
+    #Método para obtener el árbol de una componente como lista de tuplas (origen, destino, peso).
+    def tree(self, component):
+        start, stop = self.edge_offsets[component], self.edge_offsets[component + 1]
+        labels = self.labels
+        return [(labels[u], labels[v], w) for u, v, w in zip(self.src[start:stop].tolist(), self.dst[start:stop].tolist(), self.weights[start:stop].tolist())]
+
+    #Método para obtener todas las componentes como (nodos, árbol, peso total).
+    def components(self):
+        return [(self.component_nodes(c), self.tree(c), float(self.totals[c])) for c in range(self.count)]
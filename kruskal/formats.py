@@ -0,0 +1,26 @@
+#Formatos binarios: el archivo de Graph.save/Graph.load y el registro de una arista.
+
+import struct #Importamos struct para leer y escribir encabezados y aristas en binario.
+
+import numpy as np #Importamos numpy para convertir columnas de aristas en registros.
+
+GRAPH_MAGIC = b'KRSK' #Firma del formato binario de Graph.save.
+GRAPH_VERSION = 1 #Versión del formato binario.
+#Encabezado: firma, versión, banderas (bit 0 = no dirigido), número de etiquetas,
+#número de aristas y tamaño en bytes de la tabla de etiquetas.
+GRAPH_HEADER = struct.Struct('<4sHHQQQ')
+
+EDGE_RECORD = struct.Struct('<iid') #Registro binario de una arista: origen (int32), destino (int32) y peso (float64).
+EDGE_DTYPE = np.dtype([('src', '<i4'), ('dst', '<i4'), ('weight', '<f8')]) #El mismo registro como tipo de numpy.
+
+#Función para convertir columnas de aristas en bytes con el formato EDGE_RECORD.
+def edge_records(src, dst, weights):
+    records = np.empty(len(weights), dtype=EDGE_DTYPE)
+    records['src'] = src
+    records['dst'] = dst
+    records['weight'] = weights
+    return records.tobytes()
+
+#Función para convertir una etiqueta en bytes para la huella (repr distingue 1 de '1').
+def label_bytes(label):
+    return repr(label).encode('utf-8') + b'\0'
@@ -0,0 +1,128 @@
+#Aristas candidatas para árboles euclidianos: en lugar del grafo completo (O(V^2) aristas)
+#solo se generan las que pueden formar parte del árbol mínimo o del máximo.
+#scipy es opcional: se usa para la triangulación de Delaunay, los vecinos más cercanos y la
+#envolvente convexa en más de dos dimensiones; sin scipy se recurre al grafo completo.
+
+import importlib.util #Importamos importlib.util para saber si scipy está instalado.
+import itertools #Importamos itertools para las parejas de vértices de cada símplice.
+
+import numpy as np #Importamos numpy para generar y depurar las aristas candidatas.
+
+METHODS = ('auto', 'delaunay', 'knn', 'complete') #Formas de generar las candidatas del árbol mínimo.
+
+#Función para convertir parejas (i, j) en parejas únicas con i < j y sin lazos, ordenadas.
+def unique_pairs(first, second, node_count):
+    first, second = np.minimum(first, second), np.maximum(first, second)
+    keys = first[first != second].astype(np.int64) * node_count + second[first != second]
+    keys.sort() #Ordenar y quitar vecinos iguales es más rápido que np.unique con millones de parejas.
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+    return keys // node_count, keys % node_count
+
+#Función con todas las parejas de puntos (exacta para ambos árboles, pero O(V^2)).
+def complete_edges(points):
+    return np.triu_indices(len(points), 1)
+
+#Función con las aristas de la triangulación de Delaunay, que contiene el árbol euclidiano
+#mínimo. Los puntos repetidos que qhull deja fuera se unen a su vértice más cercano.
+def delaunay_edges(points):
+    from scipy.spatial import Delaunay #scipy solo se carga si se pide una triangulación.
+    if points.shape[1] == 1: #En una dimensión basta con unir cada punto con el siguiente.
+        order = np.argsort(points[:, 0], kind='stable')
+        return unique_pairs(order[:-1], order[1:], len(points))
+    if len(points) <= points.shape[1] + 1: #Muy pocos puntos para triangular: todas las parejas.
+        return complete_edges(points)
+    try:
+        triangulation = Delaunay(points)
+    except RuntimeError: #Puntos degenerados (por ejemplo, todos alineados): se triangulan con una perturbación mínima.
+        triangulation = Delaunay(points, qhull_options='QJ')
+    simplices = triangulation.simplices
+    pairs = np.array(list(itertools.combinations(range(simplices.shape[1]), 2)))
+    first = simplices[:, pairs[:, 0]].ravel()
+    second = simplices[:, pairs[:, 1]].ravel()
+    if len(triangulation.coplanar):
+        first = np.concatenate([first, triangulation.coplanar[:, 0]])
+        second = np.concatenate([second, triangulation.coplanar[:, 2]])
+    return unique_pairs(first, second, len(points))
+
+#Función con las aristas de cada punto a sus k vecinos más cercanos (árbol k-d de scipy).
+#Es aproximada: con k pequeño puede faltar alguna arista del árbol mínimo o quedar componentes sueltas.
+def knn_edges(points, k=8):
+    from scipy.spatial import cKDTree #scipy solo se carga si se pide k vecinos.
+    k = min(k, len(points) - 1)
+    if k < 1:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    _, neighbors = cKDTree(points).query(points, k + 1)
+    first = np.repeat(np.arange(len(points)), k)
+    return unique_pairs(first, neighbors[:, 1:].ravel(), len(points))
+
+#Función con los índices de los vértices de la envolvente convexa. En dos dimensiones se usa la
+#cadena monótona de Andrew; en más, scipy (o todos los puntos si no está instalado).
+def convex_hull(points):
+    if points.shape[1] == 1:
+        return np.unique([np.argmin(points[:, 0]), np.argmax(points[:, 0])])
+    if points.shape[1] > 2:
+        try:
+            from scipy.spatial import ConvexHull #scipy solo se carga para envolventes de más de 2 dimensiones.
+        except ImportError:
+            return np.arange(len(points))
+        if len(points) <= points.shape[1] + 1:
+            return np.arange(len(points))
+        try:
+            return ConvexHull(points).vertices
+        except RuntimeError: #Puntos degenerados: envolvente con una perturbación mínima.
+            return ConvexHull(points, qhull_options='QJ').vertices
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    x = points[order, 0].tolist()
+    y = points[order, 1].tolist()
+    hull = []
+    for sweep in (range(len(order)), range(len(order) - 1, -1, -1)): #Cadena inferior y después superior.
+        chain = []
+        for k in sweep:
+            while len(chain) >= 2:
+                a, b = chain[-2], chain[-1]
+                if (x[b] - x[a]) * (y[k] - y[a]) - (y[b] - y[a]) * (x[k] - x[a]) > 0: #Giro a la izquierda.
+                    break
+                chain.pop()
+            chain.append(k)
+        hull.extend(chain[:-1])
+    return np.unique(order[hull]) if hull else np.arange(len(points))
+
+#Función con las aristas candidatas del árbol euclidiano máximo: cada punto con cada vértice de
+#la envolvente convexa. El punto más lejano de cualquier punto es un vértice de la envolvente,
+#y hay un árbol máximo en el que toda arista toca la envolvente, así que bastan O(V * H) aristas.
+def farthest_edges(points):
+    hull = convex_hull(points)
+    inner = np.setdiff1d(np.arange(len(points)), hull) #Puntos que no son vértices de la envolvente.
+    hull_first, hull_second = np.triu_indices(len(hull), 1) #Parejas entre vértices, una sola vez.
+    first = np.concatenate([np.repeat(inner, len(hull)), hull[hull_first]])
+    second = np.concatenate([np.tile(hull, len(inner)), hull[hull_second]])
+    return first, second
+
+#Función para generar las aristas candidatas (i, j, distancia) de un conjunto de puntos.
+#mode: 'min', 'max' o 'both'. method elige las candidatas del árbol mínimo: 'delaunay'
+#(exacta, requiere scipy), 'knn' (aproximada, k vecinos, requiere scipy), 'complete' (exacta,
+#O(V^2)) o 'auto' (Delaunay si scipy está instalado y el grafo completo si no).
+def candidate_edges(points, mode='both', method='auto', k=8):
+    if mode not in ('min', 'max', 'both'):
+        raise ValueError(f"Modo desconocido {mode!r}; use 'min', 'max' o 'both'")
+    if method not in METHODS:
+        raise ValueError(f"Método desconocido {method!r}; use 'auto', 'delaunay', 'knn' o 'complete'")
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim == 1:
+        points = points[:, None]
+    node_count = len(points)
+    if node_count < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    if method == 'auto': #Delaunay si scipy está instalado (sin importarlo todavía).
+        method = 'delaunay' if importlib.util.find_spec('scipy') is not None else 'complete'
+    if method == 'complete':
+        first, second = complete_edges(points)
+    else:
+        parts = []
+        if mode in ('min', 'both'):
+            parts.append(delaunay_edges(points) if method == 'delaunay' else knn_edges(points, k))
+        if mode in ('max', 'both'):
+            parts.append(farthest_edges(points))
+        first, second = unique_pairs(np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]), node_count)
+    return first, second, np.linalg.norm(points[first] - points[second], axis=1)
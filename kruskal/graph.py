@@ -0,0 +1,834 @@
+#Clase Graph: grafo ponderado con aristas en columnas y árboles de expansión mínima y máxima.
+
+import hashlib #Importamos hashlib para la huella del contenido del grafo.
+import json #Importamos json para guardar la tabla de etiquetas del formato binario.
+import mmap #Importamos mmap para abrir el formato binario sin copiarlo a memoria.
+import os #Importamos os para crear la carpeta de los dibujos.
+from array import array #Importamos array para guardar las aristas en arreglos compactos.
+
+import numpy as np #Importamos numpy para ordenar las aristas como arreglos columnares.
+
+from .cursor import TreeCursor
+from .disjoint_set import CountingDisjointSet, DisjointSet
+from .formats import EDGE_RECORD, GRAPH_HEADER, GRAPH_MAGIC, GRAPH_VERSION, edge_records, label_bytes
+from .profiling import profiled, timed
+from .sorting import check_mode, chunked, lazy_order, reverse_stable
+
+ENGINES = ('kruskal', 'lazy', 'boruvka', 'filter-kruskal') #Motores de Graph.kruskal.
+LABEL_LIMIT = 1000 #Máximo de textos (nodos o pesos) por dibujo en render_trees; con más no se escriben.
+
+#Función para validar un motor de Kruskal (ver ENGINES).
+def check_engine(engine):
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido {engine!r}; use {', '.join(map(repr, ENGINES[:-1]))} o {ENGINES[-1]!r}")
+
+#Función para obtener las etiquetas como arreglo de numpy solo si son homogéneas: enteros,
+#flotantes o textos, todos del mismo tipo. Devuelve None si hay que traducirlas una por una
+#(tipos mezclados como 1 y '1', tuplas u otros objetos), porque np.asarray las convertiría.
+def label_array(nodes):
+    if isinstance(nodes, np.ndarray):
+        return nodes if nodes.ndim == 1 and nodes.dtype.kind in 'iufU' else None
+    kinds = {type(node) for node in nodes}
+    if len(kinds) != 1 or not kinds <= {int, float, str}:
+        return None
+    try:
+        return np.asarray(nodes)
+    except OverflowError: #Enteros que no caben en int64.
+        return None
+
+#Función para recuperar las etiquetas tupla guardadas con save: JSON las escribe como listas y
+#una etiqueta nunca es una lista (no se puede usar como clave), así que toda lista era una tupla.
+def tuple_label(label):
+    if isinstance(label, list):
+        return tuple(tuple_label(item) for item in label)
+    return label
+
+#Definimos de la clase Graph que representa un grafo.
+#Las aristas se guardan en columnas: identificador de origen, identificador de
+#destino y peso, cada una en un arreglo compacto.
+#Con undirected=True las aristas (u, v) y (v, u) se consideran la misma y solo se
+#guarda una; conflict decide qué hacer si llegan con pesos distintos:
+#'min' conserva el menor, 'max' conserva el mayor y 'raise' lanza un ValueError.
+#Con cache (una TreeCache) los árboles se reutilizan entre grafos con la misma huella.
+#Con profiler (un Profiler) cada ejecución de kruskal/spanning_trees deja un KruskalStats.
+class Graph:
+    def __init__(self, undirected=False, conflict='min', cache=None, profiler=None):
+        if conflict not in ('min', 'max', 'raise'):
+            raise ValueError("conflict debe ser 'min', 'max' o 'raise'")
+        self.undirected = undirected #Indica si se fusionan las aristas espejo.
+        self.conflict = conflict #Política para pesos distintos en aristas espejo.
+        self.edge_index = None #Diccionario (menor id, mayor id) -> posición (solo no dirigido; ver edge_positions).
+        self.duplicates_removed = 0 #Contador de aristas duplicadas que se fusionaron.
+        self.ids = {} #Diccionario que traduce cada etiqueta a su identificador entero.
+        self.labels = [] #Lista que traduce cada identificador entero a su etiqueta.
+        self.src = array('i') #Columna con el identificador del nodo origen de cada arista.
+        self.dst = array('i') #Columna con el identificador del nodo destino de cada arista.
+        self.weights = array('d') #Columna con el peso de cada arista.
+        self.trees = None #Árboles que se mantienen al día en modo incremental ({'min': adyacencia, 'max': adyacencia}).
+        self.mapped = None #Archivo mapeado en memoria cuando las columnas son vistas de solo lectura (ver load).
+        self.cache = cache #Caché opcional de árboles (TreeCache).
+        self.profiler = profiler #Instrumentación opcional (Profiler).
+        self.label_hash = hashlib.blake2b() #Huella incremental de las etiquetas (None si hay que recalcularla).
+        self.edge_hash = hashlib.blake2b() #Huella incremental de las aristas (None si hay que recalcularla).
+        self.nx_graph = None #(huella, grafo de networkx) reutilizado entre dibujos.
+
+    #Método para obtener (o asignar si es nueva) el identificador entero de una etiqueta.
+    def node_id(self, label):
+        node_id = self.ids.get(label)
+        if node_id is None:
+            node_id = len(self.labels) #El siguiente identificador libre.
+            self.ids[label] = node_id
+            self.labels.append(label)
+            if self.label_hash is not None:
+                self.label_hash.update(label_bytes(label)) #Actualizamos la huella de etiquetas.
+        return node_id
+
+    #Propiedad con los nodos del grafo: una vista de conjunto sobre la tabla de etiquetas, así
+    #que cada etiqueta se guarda una sola vez.
+    @property
+    def nodes(self):
+        return self.ids.keys()
+
+    #Método para agregar un nodo al grafo.
+    def add_node(self, value):
+        self.node_id(value) #Le asignamos su identificador entero.
+
+    #Método para agregar una arista al grafo.
+    def add_edge(self, from_node, to_node, weight):
+        self.append_edge(self.node_id(from_node), self.node_id(to_node), weight)
+
+    #Método para agregar una arista ya traducida a identificadores enteros.
+    def append_edge(self, u, v, weight):
+        self.make_writable()
+        if self.undirected:
+            edge_index = self.edge_positions()
+            key = (u, v) if u <= v else (v, u) #Forma canónica de la arista no dirigida.
+            position = edge_index.get(key)
+            if position is not None: #La arista (o su espejo) ya existe.
+                self.merge_duplicate(position, weight)
+                return
+            edge_index[key] = len(self.weights) #Recordamos dónde quedará la arista.
+        self.src.append(u) #Agregamos el origen a su columna.
+        self.dst.append(v) #Agregamos el destino a su columna.
+        self.weights.append(weight) #Agregamos el peso a su columna.
+        if self.edge_hash is not None:
+            self.edge_hash.update(EDGE_RECORD.pack(u, v, weight)) #Actualizamos la huella de aristas.
+        if self.trees is not None: #En modo incremental la nueva arista puede mejorar los árboles.
+            for mode in self.trees:
+                self.tree_insert(mode, u, v, weight)
+
+    #Método para fusionar una arista repetida con la que ya está guardada en position.
+    def merge_duplicate(self, position, weight):
+        current = self.weights[position]
+        if weight != current:
+            if self.conflict == 'raise':
+                u, v = self.labels[self.src[position]], self.labels[self.dst[position]]
+                raise ValueError(f'La arista {u}-{v} tiene pesos distintos: {current} y {weight}')
+            if self.conflict == 'min':
+                self.set_weight(position, min(current, weight)) #Conservamos el peso menor.
+            else:
+                self.set_weight(position, max(current, weight)) #Conservamos el peso mayor.
+        self.duplicates_removed += 1 #Contamos la arista descartada.
+
+    #Método que devuelve el índice de aristas canónicas (solo no dirigido). Se construye la primera
+    #vez que una operación de una sola arista lo necesita, así que las cargas por lotes
+    #(add_edges) no pagan un diccionario por arista.
+    def edge_positions(self):
+        if self.edge_index is None:
+            src = np.frombuffer(self.src, dtype=np.intc)
+            dst = np.frombuffer(self.dst, dtype=np.intc)
+            lows, highs = np.minimum(src, dst).tolist(), np.maximum(src, dst).tolist()
+            del src, dst #Soltamos las vistas para que las columnas puedan crecer.
+            self.edge_index = {key: position for position, key in enumerate(zip(lows, highs))}
+        return self.edge_index
+
+    #Método para agregar muchas aristas de una vez a partir de arreglos de orígenes, destinos y pesos.
+    def add_edges(self, from_nodes, to_nodes, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        if not len(from_nodes) == len(to_nodes) == len(weights):
+            raise ValueError('from_nodes, to_nodes y weights deben tener la misma longitud')
+        if len(weights) == 0:
+            return
+        from_array, to_array = label_array(from_nodes), label_array(to_nodes)
+        if from_array is None or to_array is None or (from_array.dtype.kind == 'U') != (to_array.dtype.kind == 'U'):
+            #Etiquetas de varios tipos (o tuplas, etc.): las traducimos una por una con node_id,
+            #en el mismo orden que add_edge, sin que numpy las convierta a un tipo común.
+            if isinstance(from_nodes, np.ndarray):
+                from_nodes = from_nodes.tolist()
+            if isinstance(to_nodes, np.ndarray):
+                to_nodes = to_nodes.tolist()
+            node_id = self.node_id
+            src_ids = np.empty(len(weights), dtype=np.intc)
+            dst_ids = np.empty(len(weights), dtype=np.intc)
+            for k, (u, v) in enumerate(zip(from_nodes, to_nodes)):
+                src_ids[k] = node_id(u)
+                dst_ids[k] = node_id(v)
+            self.append_edges(src_ids, dst_ids, weights)
+            return
+
+        #Traducimos cada etiqueta distinta una sola vez y después todo el arreglo de golpe. Las
+        #etiquetas nuevas reciben ids en el orden en que aparecen, igual que con add_edge.
+        endpoints = np.column_stack([from_array, to_array]).ravel() #origen0, destino0, origen1, ...
+        unique, first, inverse = np.unique(endpoints, return_index=True, return_inverse=True)
+        unique_ids = np.empty(len(unique), dtype=np.intc)
+        labels = unique.tolist()
+        for position in np.argsort(first, kind='stable').tolist():
+            unique_ids[position] = self.node_id(labels[position])
+        ids = unique_ids[inverse.ravel()].reshape(-1, 2).T.ravel() #Orígenes seguidos de destinos.
+        self.append_edges(ids[:len(weights)], ids[len(weights):], weights)
+
+    #Método para agregar muchas aristas ya traducidas a identificadores enteros.
+    def append_edges(self, src_ids, dst_ids, weights):
+        src_ids = np.asarray(src_ids, dtype=np.intc)
+        dst_ids = np.asarray(dst_ids, dtype=np.intc)
+        weights = np.asarray(weights, dtype=np.float64)
+        self.make_writable()
+
+        #En modo incremental cada arista pasa por append_edge para actualizar los árboles.
+        if self.trees is not None:
+            append_edge = self.append_edge
+            for u, v, w in zip(src_ids.tolist(), dst_ids.tolist(), weights.tolist()):
+                append_edge(u, v, w)
+            return
+        if self.undirected: #Fusionamos los espejos de una vez (ver merge_duplicates).
+            src_ids, dst_ids, weights = self.merge_duplicates(src_ids, dst_ids, weights)
+
+        self.src.frombytes(src_ids.tobytes()) #Copiamos los orígenes a su columna.
+        self.dst.frombytes(dst_ids.tobytes()) #Copiamos los destinos a su columna.
+        self.weights.frombytes(weights.tobytes()) #Copiamos los pesos a su columna.
+        if self.edge_hash is not None: #Actualizamos la huella con los mismos registros que add_edge.
+            self.edge_hash.update(edge_records(src_ids, dst_ids, weights))
+
+    #Método que fusiona por lotes las aristas no dirigidas repetidas, entre sí y con las ya
+    #guardadas, con el mismo resultado que agregarlas una por una con append_edge: la primera
+    #aparición conserva su lugar y su orientación y el peso sigue la política conflict. Con
+    #'raise' no se agrega nada si hay un conflicto. Devuelve las aristas que sí son nuevas.
+    def merge_duplicates(self, src_ids, dst_ids, weights):
+        stored = len(self.weights)
+        src = np.concatenate([np.frombuffer(self.src, dtype=np.intc), src_ids])
+        dst = np.concatenate([np.frombuffer(self.dst, dtype=np.intc), dst_ids])
+        all_weights = np.concatenate([np.frombuffer(self.weights, dtype=np.float64), weights])
+        keys = np.minimum(src, dst).astype(np.int64) << 32 | np.maximum(src, dst).astype(np.int64)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        target = first[inverse.ravel()][stored:] #Primera aparición de cada arista nueva.
+        repeated = target != np.arange(stored, len(keys)) #Aristas que no son su primera aparición.
+        if self.conflict == 'raise':
+            #Como en merge_duplicate, una repetición con NaN siempre es un conflicto (nan != nan).
+            differs = np.flatnonzero(repeated & (weights != all_weights[target]))
+            if len(differs):
+                k = differs[0]
+                u, v = self.labels[src[target[k]]], self.labels[dst[target[k]]]
+                raise ValueError(f'La arista {u}-{v} tiene pesos distintos: {all_weights[target[k]]} y {weights[k]}')
+        else:
+            #Como min y max de Python en merge_duplicate: un peso NaN ya guardado se queda y un
+            #NaN repetido se ignora (fmin y fmax ignoran NaN; después se restauran los primeros).
+            merged = all_weights.copy()
+            (np.fmin if self.conflict == 'min' else np.fmax).at(merged, target, weights)
+            merged[np.isnan(all_weights)] = np.nan
+            changed = np.flatnonzero((merged[:stored] != all_weights[:stored]) & ~np.isnan(all_weights[:stored]))
+            if len(changed): #Algunas aristas guardadas cambian de peso.
+                self.edge_hash = None
+                for position, weight in zip(changed.tolist(), merged[changed].tolist()):
+                    self.weights[position] = weight
+            all_weights = merged
+        new = np.flatnonzero(~repeated) + stored #Aristas que son su primera aparición.
+        self.duplicates_removed += len(weights) - len(new)
+        self.edge_index = None #El índice se reconstruye si alguien lo necesita.
+        return src[new], dst[new], all_weights[new]
+
+    #Método para obtener una huella estable del contenido del grafo: etiquetas (en orden de id),
+    #aristas (en orden de inserción, que decide los empates) y si es no dirigido. Agregar nodos
+    #o aristas la actualiza al momento; cambiar pesos o quitar aristas la recalcula la próxima vez.
+    def fingerprint(self):
+        if self.label_hash is None:
+            self.label_hash = hashlib.blake2b()
+            for label in self.labels:
+                self.label_hash.update(label_bytes(label))
+        if self.edge_hash is None:
+            self.edge_hash = hashlib.blake2b(edge_records(self.src, self.dst, self.weights))
+        digest = hashlib.blake2b(bytes([self.undirected]))
+        digest.update(self.label_hash.digest())
+        digest.update(self.edge_hash.digest())
+        return digest.hexdigest()
+
+    #Propiedad que reconstruye la lista de aristas (origen, destino, peso) con etiquetas.
+    @property
+    def edges(self):
+        labels = self.labels
+        src = np.frombuffer(self.src, dtype=np.intc).tolist()
+        dst = np.frombuffer(self.dst, dtype=np.intc).tolist()
+        weights = np.frombuffer(self.weights, dtype=np.float64).tolist()
+        return [(labels[u], labels[v], w) for u, v, w in zip(src, dst, weights)]
+
+    #Método para crear un grafo a partir de la representación clásica: una lista de tuplas (origen, destino, peso).
+    @classmethod
+    def from_edges(cls, edges, undirected=False, conflict='min'):
+        graph = cls(undirected, conflict)
+        edges = list(edges)
+        if edges:
+            graph.add_edges(*zip(*edges))
+        return graph
+
+    #Método para crear un grafo euclidiano a partir de puntos: un diccionario etiqueta -> coordenadas
+    #(como positions en los scripts) o un arreglo (V, d), cuyas etiquetas son 0..V-1. El peso de
+    #cada arista es la distancia, pero solo se agregan las candidatas que pueden formar parte del
+    #árbol (ver geometry.candidate_edges): mode 'min', 'max' o 'both', y method 'auto',
+    #'delaunay', 'knn' (con k vecinos) o 'complete'. Después basta con kruskal o kruskal_both.
+    @classmethod
+    def from_points(cls, points, mode='both', method='auto', k=8):
+        from .geometry import candidate_edges #scipy (opcional) solo se carga al generar candidatas.
+        graph = cls()
+        if isinstance(points, dict):
+            for label in points:
+                graph.add_node(label)
+            points = list(points.values())
+        else:
+            for label in range(len(points)):
+                graph.add_node(label)
+        first, second, distances = candidate_edges(points, mode, method, k)
+        graph.append_edges(first, second, distances)
+        return graph
+
+    #Método para guardar el grafo en el formato binario: un encabezado GRAPH_HEADER, la tabla
+    #de etiquetas en JSON y las columnas src (int32), dst (int32) y weights (float64)
+    #alineadas a 8 bytes para que load pueda mapearlas directamente.
+    def save(self, path):
+        try:
+            labels = json.dumps(self.labels).encode('utf-8')
+        except TypeError as error:
+            raise ValueError(f'Solo se pueden guardar etiquetas de texto, números o tuplas de ellos: {error}') from None
+        edge_count = len(self.weights)
+        with open(path, 'wb') as file:
+            file.write(GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, int(self.undirected), len(self.labels), edge_count, len(labels)))
+            file.write(labels)
+            file.write(bytes(-file.tell() % 8)) #Relleno para alinear la columna src.
+            file.write(self.src)
+            file.write(self.dst)
+            file.write(bytes(-file.tell() % 8)) #Relleno para alinear la columna de pesos.
+            file.write(self.weights)
+
+    #Método para abrir un grafo guardado con save. Las columnas son vistas de numpy sobre el
+    #archivo mapeado en memoria, así que Kruskal puede empezar sin leer ni copiar las aristas;
+    #solo se copian a memoria si después se modifica el grafo (ver make_writable).
+    @classmethod
+    def load(cls, path, conflict='min'):
+        with open(path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, label_count, edge_count, labels_size = GRAPH_HEADER.unpack_from(mapped)
+        if magic != GRAPH_MAGIC or version != GRAPH_VERSION:
+            raise ValueError(f'{path} no es un grafo binario compatible')
+
+        graph = cls(bool(flags & 1), conflict)
+        offset = GRAPH_HEADER.size
+        graph.labels = [tuple_label(label) for label in json.loads(mapped[offset:offset + labels_size].decode('utf-8'))]
+        graph.ids = {label: node_id for node_id, label in enumerate(graph.labels)}
+        offset += labels_size
+        offset += -offset % 8
+        graph.src = np.frombuffer(mapped, dtype=np.intc, count=edge_count, offset=offset)
+        offset += 4 * edge_count
+        graph.dst = np.frombuffer(mapped, dtype=np.intc, count=edge_count, offset=offset)
+        offset += 4 * edge_count
+        offset += -offset % 8
+        graph.weights = np.frombuffer(mapped, dtype=np.float64, count=edge_count, offset=offset)
+        graph.mapped = mapped
+        graph.label_hash = graph.edge_hash = None #La huella se calcula solo si se pide.
+        return graph
+
+    #Método para copiar a memoria las columnas de un grafo abierto con load antes de modificarlo.
+    def make_writable(self):
+        if self.mapped is None:
+            return
+        self.src = array('i', self.src.tobytes())
+        self.dst = array('i', self.dst.tobytes())
+        self.weights = array('d', self.weights.tobytes())
+        self.mapped = None #Ya no hay vistas sobre el archivo; el mapa se cierra al liberarse.
+
+    #Método para ordenar las aristas por peso; devuelve la permutación de índices.
+    def sorted_order(self, find_minimum=True):
+        weights = np.frombuffer(self.weights, dtype=np.float64)
+        #Ordenamiento estable: con pesos iguales se respeta el orden en que se agregaron las aristas.
+        if find_minimum:
+            return np.argsort(weights, kind='stable') #Ordenamos por peso ascendente.
+        return np.argsort(-weights, kind='stable') #Ordenamos por peso descendente.
+
+    #Método para convertir un orden ascendente en descendente sin volver a ordenar.
+    def reverse_order(self, order):
+        return reverse_stable(order, np.frombuffer(self.weights, dtype=np.float64))
+
+    #Método para recorrer las aristas en el orden dado y quedarnos con las que no forman ciclos.
+    #Con stats (un KruskalStats) se miden las fases y se cuentan las llamadas de union-find.
+    def build_tree(self, order, stats=None):
+        return self.scan_tree(chunked(order, 2 * len(self.labels)), stats)
+
+    #Método que recorre bloques de índices de aristas (ya en orden de peso) con union-find y
+    #devuelve el árbol como lista de tuplas (origen, destino, peso).
+    def scan_tree(self, chunks, stats=None):
+        return self.edge_tuples(self.scan_edges(chunks, stats)[1], stats)
+
+    #Método que recorre bloques de índices de aristas (ya en orden de peso) con union-find. Cada
+    #bloque se reúne y se recorre de una vez, y el recorrido termina en cuanto el árbol tiene
+    #V - 1 aristas: el resto del orden ni siquiera se reúne (ni se calcula, con lazy_order).
+    #Devuelve el union-find final y los índices de las aristas aceptadas, en orden de Kruskal.
+    def scan_edges(self, chunks, stats=None):
+        #Conjuntos disjuntos con un identificador entero por nodo (con contadores solo si se mide).
+        sets = DisjointSet(len(self.labels)) if stats is None else CountingDisjointSet(len(self.labels))
+        union = sets.union
+        target = len(self.labels) - 1 #Aristas de un árbol que cubre todos los nodos.
+        src_column = np.frombuffer(self.src, dtype=np.intc)
+        dst_column = np.frombuffer(self.dst, dtype=np.intc)
+        found = [] #Índices de las aristas aceptadas en cada bloque.
+        found_count = 0 #Aristas aceptadas hasta ahora.
+        scanned = 0 #Aristas recorridas.
+        last = -1 #Posición (en el orden) de la última arista aceptada.
+        for chunk in chunks:
+            with timed(stats, 'gather'):
+                src = src_column[chunk].tolist() #Orígenes del bloque.
+                dst = dst_column[chunk].tolist() #Destinos del bloque.
+
+            #Si la unión tiene éxito los representantes eran diferentes y no formamos un ciclo.
+            with timed(stats, 'scan'):
+                accepted = [k for k in range(len(src)) if union(src[k], dst[k])]
+            if accepted:
+                last = scanned + accepted[-1]
+                found.append(chunk[accepted])
+                found_count += len(accepted)
+            scanned += len(src)
+            if found_count >= target: #El bosque ya está conectado.
+                break
+        if stats is not None:
+            stats.add_scan(sets, scanned, found_count, last)
+        return sets, np.concatenate(found) if found else np.zeros(0, dtype=np.intp)
+
+    #Método para traducir índices de aristas a tuplas (origen, destino, peso) con etiquetas.
+    #Solo se traducen las aristas del árbol.
+    def edge_tuples(self, edges, stats=None):
+        labels = self.labels
+        with timed(stats, 'translate'):
+            src = np.frombuffer(self.src, dtype=np.intc)[edges].tolist()
+            dst = np.frombuffer(self.dst, dtype=np.intc)[edges].tolist()
+            weights = np.frombuffer(self.weights, dtype=np.float64)[edges].tolist()
+            return [(labels[u], labels[v], w) for u, v, w in zip(src, dst, weights)]
+
+    #Método para encontrar el árbol de expansión mínima o máxima usando el algoritmo de Kruskal.
+    #engine elige el motor: 'kruskal' (secuencial, ordena todas las aristas), 'lazy' (secuencial,
+    #selecciona las aristas por bloques bajo demanda: conviene cuando el árbol se completa con
+    #una fracción pequeña de las aristas, como en grafos densos), 'boruvka' o 'filter-kruskal'
+    #(paralelos, con workers procesos; por omisión uno por núcleo). Todos devuelven el mismo árbol.
+    def kruskal(self, find_minimum=True, engine='kruskal', workers=None):
+        check_engine(engine)
+        mode = 'min' if find_minimum else 'max'
+        with profiled(self, mode, engine) as stats:
+            if self.cache is None:
+                return self.compute_tree(find_minimum, engine, workers, stats)
+            key = (self.fingerprint(), mode) #Todos los motores dan el mismo árbol.
+            tree = self.cache.get(key)
+            if tree is None:
+                tree = self.compute_tree(find_minimum, engine, workers, stats)
+                self.cache.put(key, tree)
+            elif stats is not None:
+                stats.cached = True
+            return tree
+
+    #Método que calcula el árbol con el motor elegido (sin pasar por la caché).
+    def compute_tree(self, find_minimum, engine, workers, stats=None):
+        return self.edge_tuples(self.select_edges(find_minimum, engine, workers, stats)[1], stats)
+
+    #Método que ejecuta el motor elegido y devuelve el union-find final (None con los motores
+    #paralelos, que no lo exponen) y los índices de las aristas aceptadas en orden de Kruskal.
+    def select_edges(self, find_minimum, engine, workers, stats=None):
+        if engine == 'kruskal':
+            with timed(stats, 'sort'):
+                order = self.sorted_order(find_minimum)
+            return self.scan_edges(chunked(order, 2 * len(self.labels)), stats)
+        if engine == 'lazy':
+            weights = np.frombuffer(self.weights, dtype=np.float64)
+            keys = weights if find_minimum else -weights #El mismo orden estable que sorted_order.
+            return self.scan_edges(lazy_order(keys, 2 * len(self.labels), stats), stats)
+        from .parallel import ParallelEngine #Solo se carga multiprocessing si se pide un motor paralelo.
+        with timed(stats, 'engine'):
+            with ParallelEngine(self, find_minimum, workers) as parallel:
+                accepted = parallel.boruvka() if engine == 'boruvka' else parallel.filter_kruskal()
+        if stats is not None:
+            stats.accepted += len(accepted)
+        return None, np.asarray(accepted, dtype=np.intp)
+
+    #Método para obtener el bosque de expansión mínimo o máximo con resultados por componente
+    #(ver SpanningForest): componente de cada nodo y aristas y peso de cada componente. Las
+    #componentes salen del union-find final, sin otra pasada por las aristas.
+    def spanning_forest(self, mode='min', engine='kruskal', workers=None):
+        from .forest import SpanningForest #Solo se carga al pedir un bosque.
+        check_mode(mode)
+        check_engine(engine)
+        with profiled(self, mode, engine) as stats:
+            sets, edges = self.select_edges(mode == 'min', engine, workers, stats)
+            return SpanningForest(self, mode, edges, sets)
+
+    #Método para construir un índice de cuellos de botella sobre el árbol 'min' o 'max' (ver
+    #BottleneckIndex): después cada consulta entre dos nodos cuesta O(log V), y query_many o
+    #query_ids responden millones de parejas de forma vectorizada.
+    def bottleneck_index(self, mode='min', engine='kruskal', workers=None):
+        from .bottleneck import BottleneckIndex #Solo se carga al pedir un índice.
+        check_mode(mode)
+        check_engine(engine)
+        with profiled(self, mode, engine) as stats:
+            _, edges = self.select_edges(mode == 'min', engine, workers, stats)
+            with timed(stats, 'index'):
+                return BottleneckIndex(self, mode, edges)
+
+    #Método para encontrar varios árboles ('min' y/o 'max') ordenando las aristas una sola vez.
+    #El árbol mínimo recorre el orden hacia adelante y el máximo hacia atrás.
+    def spanning_trees(self, modes=('min', 'max')):
+        for mode in modes:
+            check_mode(mode)
+        with profiled(self, '+'.join(modes), 'kruskal') as stats:
+            return self.build_trees(modes, stats)
+
+    #Método que calcula los árboles de spanning_trees (primero los busca en la caché).
+    def build_trees(self, modes, stats=None):
+        trees = {}
+        if self.cache is not None: #Primero buscamos en la caché; solo se calculan los que falten.
+            fingerprint = self.fingerprint()
+            for mode in modes:
+                tree = self.cache.get((fingerprint, mode))
+                if tree is not None:
+                    trees[mode] = tree
+            missing = [mode for mode in modes if mode not in trees]
+            if not missing:
+                if stats is not None:
+                    stats.cached = True
+                return trees
+        with timed(stats, 'sort'):
+            order = self.sorted_order(find_minimum=True) #Único ordenamiento, ascendente.
+        if 'min' in modes and 'min' not in trees:
+            trees['min'] = self.build_tree(order, stats) #Árbol de expansión mínima.
+            if self.cache is not None:
+                self.cache.put((fingerprint, 'min'), trees['min'])
+        if 'max' in modes and 'max' not in trees:
+            with timed(stats, 'sort'):
+                reverse = self.reverse_order(order)
+            trees['max'] = self.build_tree(reverse, stats) #Árbol de expansión máxima.
+            if self.cache is not None:
+                self.cache.put((fingerprint, 'max'), trees['max'])
+        return trees
+
+    #Método para obtener el árbol mínimo y el máximo con un solo ordenamiento.
+    def kruskal_both(self):
+        trees = self.spanning_trees(('min', 'max'))
+        return trees['min'], trees['max']
+
+    #Método para obtener los k mejores árboles de expansión 'min' (o 'max') distintos en orden de
+    #costo, como lista de (peso total, árbol); el primero es el de kruskal. Con tolerance se paran
+    #antes de que el costo se aleje más que eso del óptimo (alternativas casi óptimas). Dos árboles
+    #son distintos si no usan las mismas aristas; ver kbest.iter_best_trees.
+    def k_best_spanning_trees(self, k=10, mode='min', tolerance=None):
+        from .kbest import iter_best_trees #Solo se carga al pedir árboles alternativos.
+        trees = []
+        for total, edges in iter_best_trees(self, mode):
+            if len(trees) >= k or (tolerance is not None and trees and abs(total - trees[0][0]) > tolerance):
+                break
+            trees.append((total, self.edge_tuples(edges)))
+        return trees
+
+    #Método para contar los árboles de expansión 'min' (o 'max') distintos, todos con el mismo peso
+    #óptimo, agrupando las aristas de pesos iguales (ver kbest.count_best_trees).
+    def count_best_spanning_trees(self, mode='min'):
+        from .kbest import count_best_trees #Solo se carga al pedir árboles alternativos.
+        return count_best_trees(self, mode)
+
+    #Método para crear un índice de escenarios (ver ScenarioIndex): ordena las aristas una sola vez
+    #y después cada árbol con pesos transformados (monótonos), umbrales o filtros se calcula sin
+    #volver a ordenar; con reweight los cambios arbitrarios solo ordenan las aristas cambiadas.
+    def scenario_index(self):
+        from .scenarios import ScenarioIndex #Solo se carga al pedir un índice de escenarios.
+        return ScenarioIndex(self)
+
+    #Método para recorrer el árbol 'min' o 'max' arista por arista, con su peso acumulado y las
+    #componentes que quedan. Devuelve un TreeCursor: se cancela dejando de iterar y se reanuda
+    #iterándolo otra vez o pasándolo como cursor (por ejemplo, después de cargarlo con pickle).
+    def iter_spanning_tree(self, mode='min', cursor=None):
+        if cursor is None:
+            return TreeCursor(self, mode)
+        if cursor.mode != mode:
+            raise ValueError(f'El cursor recorre el árbol {cursor.mode!r}, no {mode!r}')
+        return cursor.attach(self)
+
+    #Método para activar el modo incremental: se calculan los árboles una vez y después
+    #add_edge, remove_edge y update_weight los actualizan sin volver a ejecutar Kruskal. Una
+    #inserción cuesta O(V): busca el camino del árbol con un recorrido desde un extremo, que puede
+    #visitar toda su componente. Una eliminación cuesta O(V + E): recorre un lado del corte y
+    #revisa todas las aristas (vectorizado) para elegir la de reemplazo.
+    def enable_incremental(self, modes=('min', 'max')):
+        if not self.undirected:
+            raise ValueError('El modo incremental requiere un grafo no dirigido (undirected=True)')
+        self.make_writable()
+        self.trees = {}
+        for mode, tree_edges in self.spanning_trees(modes).items():
+            adjacency = {} #Adyacencia del árbol: nodo -> {vecino: peso}.
+            for from_node, to_node, weight in tree_edges:
+                u, v = self.ids[from_node], self.ids[to_node]
+                adjacency.setdefault(u, {})[v] = weight
+                adjacency.setdefault(v, {})[u] = weight
+            self.trees[mode] = adjacency
+
+    #Método para obtener el árbol que se mantiene en modo incremental como lista de aristas.
+    def spanning_tree(self, mode='min'):
+        adjacency = self.trees[mode]
+        labels = self.labels
+        tree = []
+        for u, neighbors in adjacency.items():
+            for v in neighbors:
+                if u < v: #Cada arista aparece dos veces en la adyacencia; la tomamos una sola vez.
+                    position = self.edge_positions()[(u, v)]
+                    tree.append((labels[self.src[position]], labels[self.dst[position]], self.weights[position]))
+        return tree
+
+    #Método para eliminar una arista del grafo (y de los árboles en modo incremental).
+    #La última arista ocupa el lugar de la eliminada, así que el orden de inserción cambia.
+    def remove_edge(self, from_node, to_node):
+        self.make_writable()
+        u, v = self.ids[from_node], self.ids[to_node]
+        position = self.find_edge(u, v)
+        last = len(self.weights) - 1
+        if self.undirected:
+            edge_index = self.edge_positions()
+            del edge_index[(u, v) if u <= v else (v, u)]
+            if position != last: #La última arista se mueve al hueco.
+                a, b = self.src[last], self.dst[last]
+                edge_index[(a, b) if a <= b else (b, a)] = position
+        self.src[position] = self.src[last]
+        self.dst[position] = self.dst[last]
+        self.weights[position] = self.weights[last]
+        self.src.pop()
+        self.dst.pop()
+        self.weights.pop()
+        self.edge_hash = None #La huella de aristas hay que recalcularla.
+        if self.trees is not None:
+            for mode, adjacency in self.trees.items():
+                if v in adjacency.get(u, ()): #Solo importa si la arista estaba en el árbol.
+                    self.tree_cut(adjacency, u, v)
+                    self.tree_reconnect(mode, u)
+
+    #Método para cambiar el peso de una arista existente.
+    def update_weight(self, from_node, to_node, weight):
+        self.make_writable()
+        self.set_weight(self.find_edge(self.ids[from_node], self.ids[to_node]), weight)
+
+    #Método para encontrar la posición de la arista u-v en las columnas.
+    def find_edge(self, u, v):
+        if self.undirected:
+            position = self.edge_positions().get((u, v) if u <= v else (v, u))
+        else:
+            matches = np.flatnonzero((np.frombuffer(self.src, dtype=np.intc) == u) & (np.frombuffer(self.dst, dtype=np.intc) == v))
+            position = int(matches[0]) if len(matches) else None
+        if position is None:
+            raise KeyError(f'No existe la arista {self.labels[u]}-{self.labels[v]}')
+        return position
+
+    #Método para escribir un nuevo peso y actualizar los árboles en modo incremental.
+    def set_weight(self, position, weight):
+        self.make_writable()
+        self.edge_hash = None #La huella de aristas hay que recalcularla.
+        old = self.weights[position]
+        self.weights[position] = weight
+        if self.trees is None or weight == old:
+            return
+        u, v = self.src[position], self.dst[position]
+        for mode, adjacency in self.trees.items():
+            sign = 1 if mode == 'min' else -1 #Con el signo, 'mejor' siempre significa 'menor'.
+            if v in adjacency.get(u, ()):
+                if sign * weight < sign * old: #Una arista del árbol que mejora sigue en el árbol.
+                    adjacency[u][v] = adjacency[v][u] = weight
+                else: #Si empeora, puede que otra arista cruce el corte con mejor peso.
+                    self.tree_cut(adjacency, u, v)
+                    self.tree_reconnect(mode, u)
+            elif sign * weight < sign * old: #Una arista fuera del árbol que mejora puede entrar.
+                self.tree_insert(mode, u, v, weight)
+
+    #Método para insertar una arista en un árbol incremental: si cierra un ciclo,
+    #reemplaza a la peor arista del ciclo cuando la nueva es mejor.
+    def tree_insert(self, mode, u, v, weight):
+        if u == v:
+            return
+        adjacency = self.trees[mode]
+        sign = 1 if mode == 'min' else -1
+        path = self.tree_path(adjacency, u, v)
+        if path is not None:
+            a, b = max(path, key=lambda edge: sign * adjacency[edge[0]][edge[1]]) #Peor arista del ciclo.
+            if sign * weight >= sign * adjacency[a][b]:
+                return #La nueva arista no mejora el árbol.
+            self.tree_cut(adjacency, a, b)
+        adjacency.setdefault(u, {})[v] = weight
+        adjacency.setdefault(v, {})[u] = weight
+
+    #Método para buscar el camino de u a v en un árbol; devuelve sus aristas o None si no están
+    #conectados. El árbol no guarda padres, así que se recorre desde u hasta encontrar v: O(V).
+    def tree_path(self, adjacency, u, v):
+        parent = {u: None}
+        stack = [u]
+        while stack and v not in parent:
+            node = stack.pop()
+            for neighbor in adjacency.get(node, ()):
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    stack.append(neighbor)
+        if v not in parent:
+            return None
+        path = []
+        node = v
+        while parent[node] is not None: #Subimos de v hasta u.
+            path.append((parent[node], node))
+            node = parent[node]
+        return path
+
+    #Método para quitar la arista a-b de la adyacencia de un árbol.
+    def tree_cut(self, adjacency, a, b):
+        del adjacency[a][b]
+        del adjacency[b][a]
+
+    #Método para reconectar las dos partes de un árbol tras un corte con la mejor
+    #arista que cruce el corte (la del lado de u contra el resto). Cuesta O(V + E): marca el
+    #lado de u y revisa todas las aristas.
+    def tree_reconnect(self, mode, u):
+        adjacency = self.trees[mode]
+        side = np.zeros(len(self.labels), dtype=bool) #Marca los nodos del lado de u.
+        stack = [u]
+        side[u] = True
+        while stack:
+            for neighbor in adjacency.get(stack.pop(), ()):
+                if not side[neighbor]:
+                    side[neighbor] = True
+                    stack.append(neighbor)
+        src = np.frombuffer(self.src, dtype=np.intc)
+        dst = np.frombuffer(self.dst, dtype=np.intc)
+        weights = np.frombuffer(self.weights, dtype=np.float64)
+        crossing = np.flatnonzero(side[src] != side[dst]) #Aristas que cruzan el corte.
+        if len(crossing) == 0:
+            return #El grafo quedó desconectado; el árbol pasa a ser un bosque.
+        sign = 1 if mode == 'min' else -1
+        best = crossing[np.argmin(sign * weights[crossing])] #Mejor arista de reemplazo.
+        a, b, weight = int(src[best]), int(dst[best]), float(weights[best])
+        adjacency.setdefault(a, {})[b] = weight
+        adjacency.setdefault(b, {})[a] = weight
+
+    #Método para calcular posiciones automáticas (etiqueta -> (x, y)) para cualquier grafo.
+    #method='tree' usa el árbol de expansión (tree_edges, por omisión el mínimo) como esqueleto
+    #y lo dispone en forma radial en O(V); method='force' parte de esa disposición y la ajusta
+    #con fuerzas sobre todas las aristas (ver force_layout). Las disposiciones se guardan en
+    #LAYOUT_CACHE por huella del grafo, así que dibujar otra vez el mismo mapa no las recalcula.
+    def layout(self, method='tree', iterations=50, tree_edges=None):
+        from .layout import LAYOUT_CACHE, force_layout, radial_tree_layout
+        if method not in ('tree', 'force'):
+            raise ValueError(f"Disposición desconocida {method!r}; use 'tree' o 'force'")
+        key = (self.fingerprint(), method, iterations) if tree_edges is None else None
+        if key is not None:
+            cached = LAYOUT_CACHE.get(key)
+            if cached is not None:
+                return {label: (x, y) for label, x, y in cached}
+        if tree_edges is None:
+            tree_edges = self.kruskal()
+        ids = self.ids
+        coords = radial_tree_layout(len(self.labels), [(ids[u], ids[v]) for u, v, _ in tree_edges])
+        if method == 'force':
+            coords = force_layout(coords, np.frombuffer(self.src, dtype=np.intc), np.frombuffer(self.dst, dtype=np.intc), iterations)
+        positions = {label: (x, y) for label, (x, y) in zip(self.labels, coords.tolist())}
+        if key is not None:
+            LAYOUT_CACHE.put(key, [(label, x, y) for label, (x, y) in positions.items()])
+        return positions
+
+    #Método para obtener el grafo de networkx con todas las aristas. Se construye una sola vez
+    #por contenido (huella) y se reutiliza entre dibujos, por ejemplo del árbol mínimo y el máximo.
+    def networkx_graph(self):
+        import networkx as nx #Importamos networkx solo cuando se dibuja.
+        fingerprint = self.fingerprint()
+        if self.nx_graph is None or self.nx_graph[0] != fingerprint:
+            G = nx.Graph() #Creamos un objeto Graph de networkx.
+            G.add_nodes_from(self.labels)
+            G.add_weighted_edges_from(self.edges) #Agregamos todas las aristas al grafo de networkx.
+            self.nx_graph = (fingerprint, G)
+        return self.nx_graph[1]
+
+    #Método para dibujar el árbol de expansión en un gráfico.
+    def draw_tree(self, tree_edges, all_edges=None, positions=None, figsize=(8, 6)):
+        import matplotlib.pyplot as plt #Importamos matplotlib solo cuando se dibuja.
+        import networkx as nx #Importamos networkx solo cuando se dibuja.
+
+        #Sin all_edges se dibujan todas las aristas del grafo y se reutiliza su grafo de networkx.
+        if all_edges is None:
+            G = self.networkx_graph()
+            all_edges = list(G.edges)
+        else:
+            G = nx.Graph() #Creamos un objeto Graph de networkx.
+            G.add_weighted_edges_from(all_edges) #Agregamos todas las aristas al grafo de networkx.
+        positions = positions or self.layout() #Sin posiciones dadas se calculan automáticamente.
+
+        plt.figure(figsize=figsize) #Configuramos el tamaño de la figura.
+
+        #Dibujamos los nodos con sus nombres y todas las aristas en color negro (una sola vez).
+        nx.draw_networkx_nodes(G, pos=positions, node_color='skyblue', node_size=1000)
+        nx.draw_networkx_labels(G, pos=positions, font_size=10, font_weight='bold')
+        nx.draw_networkx_edges(G, pos=positions, edgelist=all_edges, edge_color='black', width=1)
+
+        #Dibujamos las aristas del árbol de expansión en rojo.
+        nx.draw_networkx_edges(G, pos=positions, edgelist=tree_edges, edge_color='red', width=2)
+
+        #Etiquetamos las aristas con sus pesos.
+        edge_labels = {(u, v): d['weight'] for u, v, d in G.edges(data=True)}
+        nx.draw_networkx_edge_labels(G, pos=positions, edge_labels=edge_labels)
+
+        plt.axis('off')
+        plt.title('Árbol de Expansión') #Título del gráfico.
+        plt.show() #Mostramos el gráfico.
+
+    #Método para guardar dibujos de varios árboles en archivos PNG/SVG sin abrir ventanas.
+    #trees es un diccionario nombre -> aristas del árbol; se escribe un archivo por nombre y
+    #formato en directory. Todas las aristas se dibujan con una sola LineCollection que se
+    #calcula una vez para todos los árboles. Con max_edges se dibuja solo una muestra de las
+    #aristas que no son del árbol; edge_labels puede ser 'tree' (solo el árbol), 'all' o None.
+    #Las etiquetas de nodos o de aristas solo se escriben si no pasan de LABEL_LIMIT, porque
+    #cada texto de matplotlib es caro. Devuelve la lista de rutas escritas.
+    def render_trees(self, trees, directory='.', formats=('png',), positions=None, max_edges=None,
+                     edge_labels='tree', node_labels=True, figsize=(10, 8), dpi=100):
+        from matplotlib.collections import LineCollection #Para dibujar muchas aristas de una vez.
+        from matplotlib.figure import Figure #Para guardar dibujos sin abrir ventanas.
+
+        positions = positions or self.layout() #Sin posiciones dadas se calculan automáticamente.
+        coords = np.array([positions[label] for label in self.labels], dtype=np.float64).reshape(-1, 2)
+        src = np.frombuffer(self.src, dtype=np.intc)
+        dst = np.frombuffer(self.dst, dtype=np.intc)
+        weights = np.frombuffer(self.weights, dtype=np.float64)
+        background = np.arange(len(weights))
+        if max_edges is not None and len(background) > max_edges: #Muestra reproducible de las aristas.
+            background = np.sort(np.random.default_rng(0).choice(background, size=max_edges, replace=False))
+        segments = np.stack([coords[src[background]], coords[dst[background]]], axis=1) #Segmentos (k, 2, 2).
+        os.makedirs(directory, exist_ok=True)
+
+        paths = []
+        for name, tree_edges in trees.items():
+            figure = Figure(figsize=figsize) #Figura sin pyplot: no necesita pantalla.
+            axes = figure.add_subplot()
+            axes.set_axis_off()
+            axes.set_title(f'Árbol de Expansión ({name})')
+
+            #Todas las aristas en negro y las del árbol en rojo, cada grupo con una sola llamada.
+            axes.add_collection(LineCollection(segments, colors='black', linewidths=0.5 if len(segments) > 1000 else 1))
+            tree_coords = np.array([[positions[u], positions[v]] for u, v, _ in tree_edges], dtype=np.float64).reshape(-1, 2, 2)
+            axes.add_collection(LineCollection(tree_coords, colors='red', linewidths=2))
+            axes.scatter(coords[:, 0], coords[:, 1], s=300 if len(coords) <= 100 else 4, c='skyblue', zorder=3)
+
+            if node_labels and len(coords) <= LABEL_LIMIT:
+                for label, (x, y) in zip(self.labels, coords.tolist()):
+                    axes.text(x, y, str(label), ha='center', va='center', fontsize=10, fontweight='bold', zorder=4)
+            if edge_labels == 'tree' and len(tree_coords) <= LABEL_LIMIT:
+                for (start, end), (_, _, weight) in zip(tree_coords.tolist(), tree_edges):
+                    axes.text((start[0] + end[0]) / 2, (start[1] + end[1]) / 2, f'{weight:g}', fontsize=8, zorder=4)
+            elif edge_labels == 'all' and len(segments) <= LABEL_LIMIT:
+                middles = segments.mean(axis=1)
+                for (x, y), weight in zip(middles.tolist(), weights[background].tolist()):
+                    axes.text(x, y, f'{weight:g}', fontsize=8, zorder=4)
+
+            axes.autoscale_view()
+            for extension in formats:
+                path = os.path.join(directory, f'{name}.{extension}')
+                figure.savefig(path, dpi=dpi)
+                paths.append(path)
+        return paths
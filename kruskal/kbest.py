@@ -0,0 +1,205 @@
+#Árboles de expansión alternativos: los k mejores en orden de costo y el conteo de árboles
+#óptimos distintos cuando hay pesos empatados.
+
+import heapq #Importamos heapq para la cola de prioridad de subproblemas.
+import itertools #Importamos itertools para desempatar la cola en orden de llegada.
+import math #Importamos math para sumar pesos sin errores de redondeo acumulados.
+
+import numpy as np #Importamos numpy para reunir las aristas por bloques.
+
+from .disjoint_set import DisjointSet
+from .sorting import check_mode, chunked
+
+#Función para calcular, para cada arista libre de un árbol, la mejor arista de reemplazo: la
+#primera arista (en el orden de Kruskal, sin contar las del árbol ni las excluidas) cuyo camino
+#en el árbol pasa por ella. Las aristas se recorren una vez y cada arista del árbol se cubre una
+#sola vez gracias a un union-find de saltos hacia la raíz (jump): al cubrir la arista de un nodo
+#con su padre, el nodo se une a su padre y los caminos siguientes la saltan. Las aristas
+#incluidas se unen desde el principio, así que nunca reciben reemplazo.
+#Devuelve un diccionario posición en tree -> índice de la arista de reemplazo.
+def replacements(graph, order, tree, included, excluded):
+    node_count = len(graph.labels)
+    src_column = np.frombuffer(graph.src, dtype=np.intc)
+    dst_column = np.frombuffer(graph.dst, dtype=np.intc)
+    tree_list = tree.tolist()
+
+    #Enraizamos cada componente del bosque: padre, profundidad y posición de la arista al padre.
+    adjacency = {}
+    for position, (u, v) in enumerate(zip(src_column[tree].tolist(), dst_column[tree].tolist())):
+        adjacency.setdefault(u, []).append((v, position))
+        adjacency.setdefault(v, []).append((u, position))
+    parent = list(range(node_count))
+    depth = [0] * node_count
+    parent_edge = [-1] * node_count
+    seen = [False] * node_count
+    for root in adjacency:
+        if seen[root]:
+            continue
+        seen[root] = True
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for neighbor, position in adjacency[node]:
+                if not seen[neighbor]:
+                    seen[neighbor] = True
+                    parent[neighbor] = node
+                    depth[neighbor] = depth[node] + 1
+                    parent_edge[neighbor] = position
+                    stack.append(neighbor)
+
+    jump = list(range(node_count))
+    pending = len(tree_list) #Aristas del árbol que aún no tienen reemplazo.
+    for node in range(node_count):
+        if parent_edge[node] >= 0 and tree_list[parent_edge[node]] in included:
+            jump[node] = parent[node]
+            pending -= 1
+    found = {}
+    if pending == 0:
+        return found
+
+    #Recorremos las aristas candidatas (fuera del árbol y no excluidas) en orden de Kruskal.
+    blocked = np.zeros(len(graph.weights), dtype=bool)
+    blocked[tree] = True
+    if excluded:
+        blocked[list(excluded)] = True
+    candidates = order[~blocked[order]]
+    for chunk in chunked(candidates, 4 * node_count):
+        for edge, u, v in zip(chunk.tolist(), src_column[chunk].tolist(), dst_column[chunk].tolist()):
+            while jump[u] != u: #Representantes con división a la mitad.
+                jump[u] = jump[jump[u]]
+                u = jump[u]
+            while jump[v] != v:
+                jump[v] = jump[jump[v]]
+                v = jump[v]
+            while u != v: #Subimos por el lado más profundo cubriendo aristas hasta el ancestro común.
+                if depth[u] < depth[v]:
+                    u, v = v, u
+                found[parent_edge[u]] = edge
+                pending -= 1
+                jump[u] = parent[u]
+                u = parent[u]
+                while jump[u] != u:
+                    jump[u] = jump[jump[u]]
+                    u = jump[u]
+            if pending == 0:
+                return found
+    return found
+
+#Función generadora que entrega los árboles de expansión 'min' (o 'max') en orden de costo
+#creciente (decreciente con 'max'), cada uno una sola vez, como (peso total, índices de sus
+#aristas en orden de Kruskal). El primero es exactamente el de kruskal. Usa la partición de
+#Gabow y Katoh-Ibaraki-Mine: cada subproblema fija aristas incluidas y excluidas, y al sacar su
+#árbol T de la cola se divide en hijos disjuntos (el hijo i incluye las i primeras aristas libres
+#de T y excluye la siguiente). El mejor árbol de cada hijo es T sin esa arista más su mejor
+#reemplazo, así que todos los hijos salen de una sola pasada de replacements, sin volver a
+#ejecutar Kruskal. Los árboles de los hijos solo se construyen al salir de la cola.
+#En grafos no conexos se enumeran bosques de expansión.
+def iter_best_trees(graph, mode='min'):
+    check_mode(mode)
+    weights = np.frombuffer(graph.weights, dtype=np.float64)
+    sign = 1 if mode == 'min' else -1 #Con el signo, la cola siempre saca el menor.
+    order = graph.sorted_order(mode == 'min') #Único ordenamiento, compartido por todos los subproblemas.
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order)) #Posición de cada arista en el orden de Kruskal.
+    _, first = graph.scan_edges(chunked(order, 2 * len(graph.labels)))
+    counter = itertools.count()
+    #Cada entrada: (costo con signo, llegada, árbol del padre, incluidas del padre, excluidas del
+    #padre, posición de la arista que sale o -1 para la raíz, arista que entra).
+    queue = [(sign * math.fsum(weights[first].tolist()), next(counter), first, frozenset(), frozenset(), -1, -1)]
+    while queue:
+        cost, _, tree, included, excluded, position, edge = heapq.heappop(queue)
+        if position >= 0: #Construimos el árbol del hijo: el del padre con el reemplazo.
+            removed = int(tree[position])
+            included = included.union(tree[:position].tolist())
+            excluded = excluded.union((removed,))
+            tree = tree.copy()
+            tree[position] = edge
+            tree = tree[np.argsort(rank[tree], kind='stable')]
+        total = sign * cost
+        yield total, tree
+        for position, edge in replacements(graph, order, tree, included, excluded).items():
+            child_cost = sign * math.fsum((total, weights[edge], -weights[tree[position]]))
+            heapq.heappush(queue, (child_cost, next(counter), tree, included, excluded, position, edge))
+
+#Función para el determinante exacto de una matriz de enteros (eliminación de Bareiss, sin fracciones).
+def determinant(matrix):
+    size = len(matrix)
+    sign = 1
+    previous = 1
+    for k in range(size - 1):
+        if matrix[k][k] == 0:
+            pivot = next((i for i in range(k + 1, size) if matrix[i][k] != 0), None)
+            if pivot is None:
+                return 0
+            matrix[k], matrix[pivot] = matrix[pivot], matrix[k]
+            sign = -sign
+        for i in range(k + 1, size):
+            for j in range(k + 1, size):
+                matrix[i][j] = (matrix[i][j] * matrix[k][k] - matrix[i][k] * matrix[k][j]) // previous
+        previous = matrix[k][k]
+    return sign * matrix[-1][-1] if size else 1
+
+#Función para contar los árboles de expansión de un multigrafo conexo con el teorema de Kirchhoff:
+#el determinante del laplaciano sin su última fila y columna. Las aristas paralelas cuentan aparte.
+def spanning_tree_count(nodes, pairs):
+    index = {node: k for k, node in enumerate(nodes)}
+    size = len(nodes) - 1
+    laplacian = [[0] * size for _ in range(size)]
+    for u, v in pairs:
+        a, b = index[u], index[v]
+        if a < size:
+            laplacian[a][a] += 1
+        if b < size:
+            laplacian[b][b] += 1
+        if a < size and b < size:
+            laplacian[a][b] -= 1
+            laplacian[b][a] -= 1
+    return determinant(laplacian)
+
+#Función para contar los árboles de expansión óptimos distintos ('min' o 'max'). Las aristas se
+#agrupan por peso; antes de cada grupo el union-find de Kruskal ya tiene contraídas las
+#componentes de los pesos mejores, y cada árbol óptimo toma de ese grupo un bosque que conecta
+#lo mismo. Así el total es el producto, sobre grupos y sobre componentes del multigrafo del grupo
+#entre representantes, de su número de árboles de expansión. El resultado es un entero exacto.
+def count_best_trees(graph, mode='min'):
+    check_mode(mode)
+    order = graph.sorted_order(mode == 'min')
+    weights = np.frombuffer(graph.weights, dtype=np.float64)[order]
+    src = np.frombuffer(graph.src, dtype=np.intc)[order].tolist()
+    dst = np.frombuffer(graph.dst, dtype=np.intc)[order].tolist()
+    starts = np.flatnonzero(np.r_[True, weights[1:] != weights[:-1]]).tolist() + [len(order)]
+    sets = DisjointSet(len(graph.labels))
+    remaining = len(graph.labels) - 1 #Uniones que faltan para un árbol que cubra todo.
+    count = 1
+    for start, stop in zip(starts[:-1], starts[1:]):
+        if remaining <= 0:
+            break
+        #Aristas del grupo entre componentes distintas, ya como parejas de representantes.
+        pairs = []
+        for k in range(start, stop):
+            u, v = sets.find(src[k]), sets.find(dst[k])
+            if u != v:
+                pairs.append((u, v))
+        if not pairs:
+            continue
+        #Componentes del multigrafo del grupo (con un union-find local sobre los representantes).
+        local = {}
+        def root(node):
+            while local.setdefault(node, node) != node:
+                local[node] = local[local[node]]
+                node = local[node]
+            return node
+        for u, v in pairs:
+            a, b = root(u), root(v)
+            if a != b:
+                local[a] = b
+        groups = {}
+        for u, v in pairs:
+            groups.setdefault(root(u), []).append((u, v))
+        for group_pairs in groups.values():
+            nodes = sorted({node for pair in group_pairs for node in pair})
+            count *= spanning_tree_count(nodes, group_pairs)
+        for u, v in pairs:
+            if sets.union(u, v):
+                remaining -= 1
+    return count
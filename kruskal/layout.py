@@ -0,0 +1,123 @@
+#Disposición automática de nodos para dibujar grafos sin posiciones fijas.
+
+import numpy as np #Importamos numpy para calcular las fuerzas de forma vectorizada.
+
+from .cache import TreeCache
+
+LAYOUT_CACHE = TreeCache(max_entries=32) #Disposiciones calculadas por Graph.layout, por huella del grafo.
+
+#Función para disponer un bosque en forma radial en O(V): cada componente se cuelga de su
+#nodo de mayor grado, la profundidad da el radio y cada subárbol recibe un sector del
+#círculo proporcional a sus hojas. Las componentes se colocan una al lado de otra.
+#Devuelve un arreglo (node_count, 2) con las coordenadas de cada id.
+def radial_tree_layout(node_count, tree_pairs):
+    adjacency = [[] for _ in range(node_count)]
+    for u, v in tree_pairs:
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+    coords = np.zeros((node_count, 2))
+    parent = [-1] * node_count
+    depth = [0] * node_count
+    leaves = [0] * node_count
+    start = [0.0] * node_count #Ángulo donde empieza el sector de cada nodo.
+    width = [0.0] * node_count #Amplitud del sector de cada nodo.
+    seen = bytearray(node_count)
+    offset = 0.0 #Desplazamiento horizontal de la siguiente componente.
+    for root in sorted(range(node_count), key=lambda node: -len(adjacency[node])):
+        if seen[root]:
+            continue
+        seen[root] = 1
+        order = [root] #Recorrido en anchura de la componente.
+        for node in order:
+            for neighbor in adjacency[node]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    parent[neighbor] = node
+                    depth[neighbor] = depth[node] + 1
+                    order.append(neighbor)
+        for node in reversed(order): #Hojas de cada subárbol, de abajo hacia arriba.
+            leaves[node] = leaves[node] or 1
+            if parent[node] >= 0:
+                leaves[parent[node]] += leaves[node]
+        start[root], width[root] = 0.0, 2 * np.pi
+        for node in order: #Repartimos el sector de cada nodo entre sus hijos.
+            angle = start[node]
+            for child in adjacency[node]:
+                if parent[child] == node:
+                    start[child] = angle
+                    width[child] = width[node] * leaves[child] / leaves[node]
+                    angle += width[child]
+        component = np.array(order)
+        radius = np.array([depth[node] for node in order], dtype=np.float64)
+        angles = np.array([start[node] + width[node] / 2 for node in order])
+        extent = radius.max()
+        coords[component, 0] = offset + extent + radius * np.cos(angles)
+        coords[component, 1] = radius * np.sin(angles)
+        offset += 2 * extent + 1
+    return coords
+
+#Función para la repulsión aproximada de force_layout con una rejilla de cells x cells: la
+#parte cercana (celda propia y sus 8 vecinas) se calcula por nodo contra los centros de masa de
+#esas celdas y la lejana por celda, entre centros de masa, y se reparte a los nodos de cada
+#celda. Devuelve el desplazamiento de cada nodo.
+def grid_repulsion(positions, k, cells):
+    low = positions.min(axis=0)
+    size = (positions.max(axis=0) - low).max() / cells or 1.0
+    cell = np.minimum(((positions - low) / size).astype(np.int64), cells - 1)
+    cell_id = cell[:, 0] * cells + cell[:, 1]
+    mass = np.bincount(cell_id, minlength=cells * cells).astype(np.float64)
+    centers = np.zeros((cells * cells, 2))
+    used = np.flatnonzero(mass)
+    centers[used, 0] = np.bincount(cell_id, positions[:, 0], cells * cells)[used] / mass[used]
+    centers[used, 1] = np.bincount(cell_id, positions[:, 1], cells * cells)[used] / mass[used]
+
+    #Campo lejano: entre celdas usadas que no son vecinas (distancia de Chebyshev mayor que 1).
+    used_cell = np.stack([used // cells, used % cells], axis=1)
+    far = np.abs(used_cell[:, None, :] - used_cell[None, :, :]).max(axis=-1) > 1
+    delta = centers[used][:, None, :] - centers[used][None, :, :]
+    distance2 = (delta ** 2).sum(axis=-1) + size * size #Suavizado, como en la parte cercana.
+    field = np.zeros((cells * cells, 2))
+    field[used] = (delta * np.where(far, mass[used] * k * k / distance2, 0.0)[..., None]).sum(axis=1)
+    displacement = field[cell_id]
+
+    #Parte cercana: cada nodo contra los centros de masa de su celda y de las 8 vecinas.
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            row, column = cell[:, 0] + dx, cell[:, 1] + dy
+            inside = (row >= 0) & (row < cells) & (column >= 0) & (column < cells)
+            neighbor = np.where(inside, row * cells + column, 0)
+            delta = positions - centers[neighbor]
+            distance2 = (delta ** 2).sum(axis=1) + size * size #Suavizado para la celda propia.
+            displacement += delta * np.where(inside, mass[neighbor] * k * k / distance2, 0.0)[:, None]
+    return displacement
+
+#Función para ajustar una disposición con fuerzas (Fruchterman-Reingold vectorizado): las
+#aristas atraen a sus extremos y los nodos se repelen. Con más de exact_limit nodos la
+#repulsión se aproxima como en Barnes-Hut, agrupando los nodos en una rejilla de cells x cells
+#con el centro de masa de cada celda: cada nodo se compara con las 9 celdas vecinas de la suya
+#y el resto de las celdas actúa sobre el centro de masa de su celda (un campo lejano que se
+#calcula entre celdas). Así cada iteración cuesta O(V + cells⁴) en tiempo y O(V + cells⁴) en
+#memoria, sin arreglos de V x cells².
+def force_layout(coords, src, dst, iterations=50, cells=32, exact_limit=2000):
+    positions = np.array(coords, dtype=np.float64)
+    node_count = len(positions)
+    if node_count < 2:
+        return positions
+    span = np.ptp(positions, axis=0).max() or 1.0
+    k = span / np.sqrt(node_count) #Distancia ideal entre nodos.
+    temperature = span / 10 #Desplazamiento máximo por iteración; se enfría poco a poco.
+    for _ in range(iterations):
+        if node_count <= exact_limit: #Repulsión exacta entre todos los pares.
+            delta = positions[:, None, :] - positions[None, :, :]
+            distance2 = (delta ** 2).sum(axis=-1) + 1e-9
+            displacement = (delta * (k * k / distance2)[..., None]).sum(axis=1)
+        else:
+            displacement = grid_repulsion(positions, k, cells)
+        delta = positions[src] - positions[dst] #Atracción a lo largo de las aristas.
+        pull = delta * (np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None]
+        np.add.at(displacement, src, -pull)
+        np.add.at(displacement, dst, pull)
+        length = np.sqrt((displacement ** 2).sum(axis=1)) + 1e-9
+        positions += displacement / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature *= 0.95
+    return positions
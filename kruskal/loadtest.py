@@ -0,0 +1,107 @@
+#Cliente de carga para kruskal.server: abre varias conexiones concurrentes, envía grafos
+#sintéticos de los generadores del banco de pruebas y resume latencias y rendimiento.
+#Con --distinct menor que --requests se repiten payloads y se ve el efecto de la coalescencia.
+#Uso: python -m kruskal.loadtest --port 8765 --concurrency 32 --requests 500 --size 2000
+
+import argparse #Importamos argparse para leer las opciones de la línea de comandos.
+import asyncio #Importamos asyncio para mantener muchas peticiones en vuelo.
+import json #Importamos json para el protocolo.
+import statistics #Importamos statistics para resumir las latencias.
+import sys #Importamos sys para la salida estándar.
+import time #Importamos time para medir.
+
+import numpy as np #Importamos numpy para generar los grafos con semilla.
+
+from .benchmark import GENERATORS
+
+#Función para construir las líneas de petición: distinct grafos distintos de unas size aristas.
+def build_payloads(kind, size, distinct, mode, seed=0):
+    payloads = []
+    for index in range(distinct):
+        src, dst, weights, _ = GENERATORS[kind](size, np.random.default_rng(seed + index))
+        edges = [[int(u), int(v), float(w)] for u, v, w in zip(src, dst, weights)]
+        payloads.append({'mode': mode, 'edges': edges, 'undirected': True})
+    return payloads
+
+#Función para abrir una conexión con el servidor (TCP o socket Unix).
+async def connect(args):
+    limit = 64 * 1024 * 1024
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix, limit=limit)
+    return await asyncio.open_connection(args.host, args.port, limit=limit)
+
+#Función de un cliente: envía sus peticiones una tras otra por su conexión y anota la latencia
+#de cada una (o el error que recibió).
+async def client(args, jobs, latencies, errors):
+    reader, writer = await connect(args)
+    try:
+        while jobs:
+            request_id, line = jobs.pop()
+            started = time.perf_counter()
+            writer.write(line)
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - started)
+            if 'error' in response:
+                errors.append(response['error'])
+    finally:
+        writer.close()
+
+#Función para pedir los contadores del servidor.
+async def server_stats(args):
+    reader, writer = await connect(args)
+    writer.write(b'{"op": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+#Función que lanza la carga y devuelve el resumen.
+async def run(args):
+    payloads = build_payloads(args.kind, args.size, min(args.distinct, args.requests), args.mode, args.seed)
+    encoded = [json.dumps(payload, separators=(',', ':')) for payload in payloads]
+    jobs = [(index, f'{{"id":{index},{line[1:]}'.encode('utf-8') + b'\n') for index, line in
+            ((index, encoded[index % len(encoded)]) for index in range(args.requests))]
+    jobs.reverse()
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(args, jobs, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    summary = {
+        'requests': len(latencies), 'concurrency': args.concurrency, 'edges': args.size, 'kind': args.kind,
+        'seconds': elapsed, 'throughput': len(latencies) / elapsed if elapsed else None,
+        'mean_ms': statistics.fmean(latencies) * 1000 if latencies else None,
+        'p50_ms': percentile(latencies, 50) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 99) * 1000 if latencies else None,
+        'errors': len(errors), 'first_error': errors[0] if errors else None,
+    }
+    summary['server'] = await server_stats(args)
+    return summary
+
+#Función para el percentil p de una lista ya ordenada (rango más cercano).
+def percentile(values, p):
+    return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+#Función para leer las opciones de la línea de comandos.
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kruskal.loadtest', description='Prueba de carga para kruskal.server.')
+    parser.add_argument('--host', default='127.0.0.1', help='Dirección del servidor.')
+    parser.add_argument('--port', type=int, default=8765, help='Puerto TCP del servidor.')
+    parser.add_argument('--unix', metavar='RUTA', help='Socket Unix del servidor en lugar de TCP.')
+    parser.add_argument('--concurrency', type=int, default=16, help='Conexiones simultáneas.')
+    parser.add_argument('--requests', type=int, default=200, help='Peticiones en total.')
+    parser.add_argument('--size', type=int, default=1000, help='Aristas por grafo.')
+    parser.add_argument('--kind', choices=sorted(GENERATORS), default='random-sparse', help='Generador de los grafos.')
+    parser.add_argument('--mode', choices=('min', 'max', 'both'), default='both', help='Árboles a pedir.')
+    parser.add_argument('--distinct', type=int, default=10 ** 9, help='Grafos distintos (los demás se repiten).')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla de los generadores.')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    summary = asyncio.run(run(parse_args(argv)))
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+if __name__ == '__main__':
+    main()
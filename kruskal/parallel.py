@@ -0,0 +1,184 @@
+#Motores paralelos (Borůvka y filter-Kruskal) con un grupo de procesos y memoria compartida.
+
+import multiprocessing #Importamos multiprocessing para repartir el trabajo entre procesos.
+import os #Importamos os para conocer el número de núcleos disponibles.
+from multiprocessing import shared_memory #Importamos shared_memory para compartir las aristas entre procesos.
+
+import numpy as np #Importamos numpy para el trabajo vectorizado de cada proceso.
+
+from .disjoint_set import DisjointSet
+
+WORKER_ARRAYS = {} #Vistas de numpy sobre la memoria compartida dentro de cada proceso del motor paralelo.
+
+#Función que cada proceso trabajador ejecuta al iniciar: se conecta a los bloques de memoria compartida.
+def worker_attach(specs):
+    WORKER_ARRAYS.clear()
+    for key, (name, dtype, count) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        WORKER_ARRAYS[key] = np.ndarray(count, dtype=dtype, buffer=block.buf)
+        WORKER_ARRAYS[key + '_block'] = block #Guardamos el bloque para que no se cierre.
+
+#Función para elegir, por componente, la mejor arista (menor clave y, en empate, menor índice).
+#Devuelve tres arreglos: componentes, claves e índices de sus mejores aristas.
+def cheapest_per_component(components, keys, indices, node_count):
+    best_key = np.full(node_count, np.inf)
+    np.minimum.at(best_key, components, keys) #Mejor clave de cada componente.
+    ties = keys == best_key[components] #Aristas que empatan con la mejor clave.
+    best_index = np.full(node_count, np.iinfo(np.int64).max)
+    np.minimum.at(best_index, components[ties], indices[ties]) #En empate gana el menor índice.
+    found = np.flatnonzero(best_index != np.iinfo(np.int64).max)
+    return found, best_key[found], best_index[found]
+
+#Tarea de Borůvka: mejor arista de cada componente dentro de las aristas [start, stop).
+def worker_cheapest(start, stop):
+    src, dst, keys, comp = (WORKER_ARRAYS[key] for key in ('src', 'dst', 'keys', 'comp'))
+    from_comp = comp[src[start:stop]]
+    to_comp = comp[dst[start:stop]]
+    active = np.flatnonzero(from_comp != to_comp) #Aristas que todavía unen componentes distintas.
+    indices = active + start
+    chunk_keys = keys[indices]
+    return cheapest_per_component(np.concatenate([from_comp[active], to_comp[active]]),
+                                  np.concatenate([chunk_keys, chunk_keys]),
+                                  np.concatenate([indices, indices]), len(comp))
+
+#Tarea de filter-Kruskal: separa los candidatos [start, stop) en los de clave <= pivot y los demás.
+def worker_partition(start, stop, pivot):
+    candidates = WORKER_ARRAYS['candidates'][start:stop]
+    low = WORKER_ARRAYS['keys'][candidates] <= pivot
+    return candidates[low], candidates[~low]
+
+#Tarea de filter-Kruskal: descarta los candidatos [start, stop) cuyos extremos ya están conectados.
+def worker_filter(start, stop):
+    candidates = WORKER_ARRAYS['candidates'][start:stop]
+    comp = WORKER_ARRAYS['comp']
+    return candidates[comp[WORKER_ARRAYS['src'][candidates]] != comp[WORKER_ARRAYS['dst'][candidates]]]
+
+#Definimos la clase ParallelEngine, que ejecuta Borůvka o filter-Kruskal repartiendo el
+#trabajo entre procesos. Las columnas de aristas, las claves de orden (peso, o -peso para
+#el árbol máximo) y la componente de cada nodo viven en memoria compartida, así que los
+#procesos no copian las aristas. Los empates se rompen por índice de arista, igual que el
+#ordenamiento estable de kruskal, por lo que el árbol es exactamente el mismo.
+class ParallelEngine:
+    def __init__(self, graph, find_minimum=True, workers=None, min_chunk=65536):
+        self.workers = workers or os.cpu_count() or 1 #Número de procesos.
+        self.min_chunk = min_chunk #Por debajo de este tamaño no vale la pena repartir el trabajo.
+        self.node_count = len(graph.labels)
+        weights = np.frombuffer(graph.weights, dtype=np.float64)
+        self.blocks = [] #Bloques de memoria compartida que hay que liberar al terminar.
+        self.specs = {} #Nombre, tipo y tamaño de cada bloque para que los procesos se conecten.
+        self.src = self.share('src', np.frombuffer(graph.src, dtype=np.intc))
+        self.dst = self.share('dst', np.frombuffer(graph.dst, dtype=np.intc))
+        self.keys = self.share('keys', weights if find_minimum else -weights)
+        self.comp = self.share('comp', np.arange(self.node_count, dtype=np.intc))
+        self.candidates = self.share('candidates', np.arange(len(weights), dtype=np.int64))
+        self.sets = DisjointSet(self.node_count)
+        WORKER_ARRAYS.clear()
+        WORKER_ARRAYS.update({key: getattr(self, key) for key in self.specs}) #El proceso principal usa las mismas vistas.
+        self.pool = None
+        if self.workers > 1 and len(weights) > self.min_chunk:
+            self.pool = multiprocessing.Pool(self.workers, initializer=worker_attach, initargs=(self.specs,))
+
+    #Método para copiar un arreglo a un bloque nuevo de memoria compartida y devolver su vista.
+    def share(self, key, values):
+        block = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+        self.blocks.append(block)
+        view = np.ndarray(len(values), dtype=values.dtype, buffer=block.buf)
+        view[:] = values
+        self.specs[key] = (block.name, values.dtype.str, len(values))
+        return view
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    #Método para cerrar los procesos y liberar la memoria compartida.
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        WORKER_ARRAYS.clear()
+        self.src = self.dst = self.keys = self.comp = self.candidates = None #Soltamos las vistas antes de cerrar.
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    #Método para repartir una tarea sobre el rango [0, count) en trozos, en paralelo si conviene.
+    def map_chunks(self, task, count, *args):
+        if self.pool is None or count <= self.min_chunk:
+            return [task(0, count, *args)]
+        step = max(self.min_chunk, -(-count // (4 * self.workers))) #Unos cuatro trozos por proceso.
+        return self.pool.starmap(task, [(start, min(start + step, count)) + args for start in range(0, count, step)])
+
+    #Método para actualizar la componente de cada nodo (su representante) saltando punteros.
+    def refresh_components(self):
+        roots = np.frombuffer(self.sets.parent, dtype=np.intc).copy()
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                break
+            roots = jumped
+        self.comp[:] = roots
+
+    #Método para unir las aristas dadas (en ese orden) y devolver las que no formaron ciclo.
+    def unite(self, indices):
+        union = self.sets.union
+        src, dst = self.src, self.dst
+        return [index for index in indices.tolist() if union(int(src[index]), int(dst[index]))]
+
+    #Método para ordenar las aristas aceptadas como lo haría kruskal: por clave y luego por índice.
+    def in_kruskal_order(self, accepted):
+        accepted = np.asarray(accepted, dtype=np.int64)
+        return accepted[np.lexsort((accepted, self.keys[accepted]))]
+
+    #Algoritmo de Borůvka: en cada ronda cada componente elige su mejor arista de salida
+    #(búsqueda repartida entre procesos) y todas se unen a la vez.
+    def boruvka(self):
+        accepted = []
+        edge_count = len(self.keys)
+        while True:
+            results = self.map_chunks(worker_cheapest, edge_count)
+            components, keys, indices = (np.concatenate(parts) for parts in zip(*results))
+            _, _, chosen = cheapest_per_component(components, keys, indices, self.node_count)
+            if len(chosen) == 0: #Ninguna componente tiene aristas de salida.
+                break
+            accepted += self.unite(np.unique(chosen))
+            self.refresh_components()
+        return self.in_kruskal_order(accepted)
+
+    #Algoritmo filter-Kruskal: parte las aristas por un pivote, resuelve primero las ligeras y
+    #antes de procesar las pesadas descarta las que ya cierran un ciclo. Partición y filtrado
+    #se reparten entre procesos.
+    def filter_kruskal(self, threshold=65536):
+        accepted = []
+        rng = np.random.default_rng(0) #Semilla fija para que los pivotes sean reproducibles.
+        pending = [(np.arange(len(self.keys), dtype=np.int64), False)] #Pila de (candidatos, hay_que_filtrar).
+        while pending:
+            candidates, needs_filter = pending.pop()
+            if needs_filter:
+                self.refresh_components()
+                candidates = self.run_on_candidates(worker_filter, candidates)
+            if len(candidates) == 0:
+                continue
+            keys = self.keys[candidates]
+            if len(candidates) > threshold:
+                pivot = np.median(rng.choice(keys, size=min(len(keys), 1001)))
+                if pivot < keys.max(): #Si todas las claves son <= pivot no se puede partir.
+                    parts = self.run_on_candidates(worker_partition, candidates, pivot)
+                    pending.append((parts[1], True)) #Las pesadas se procesan después, filtradas.
+                    pending.append((parts[0], False)) #Las ligeras primero.
+                    continue
+            #Caso base: Kruskal secuencial; candidates está en orden de índice, así que el orden estable respeta los empates.
+            accepted += self.unite(candidates[np.argsort(keys, kind='stable')])
+        return self.in_kruskal_order(accepted)
+
+    #Método para copiar candidatos a la memoria compartida y aplicarles una tarea por trozos.
+    def run_on_candidates(self, task, candidates, *args):
+        count = len(candidates)
+        self.candidates[:count] = candidates
+        results = self.map_chunks(task, count, *args)
+        if isinstance(results[0], tuple): #worker_partition devuelve dos partes.
+            return tuple(np.concatenate(parts) for parts in zip(*results))
+        return np.concatenate(results)
@@ -0,0 +1,112 @@
+#Instrumentación opcional de Kruskal: tiempos por fase y contadores de union-find.
+#Sin Profiler el grafo usa el DisjointSet normal y no mide nada; con Profiler se usa
+#CountingDisjointSet y cada ejecución deja un KruskalStats.
+
+import time #Importamos time para medir las fases.
+from collections import deque #Importamos deque para guardar solo las últimas ejecuciones.
+from contextlib import contextmanager, nullcontext #Importamos contextmanager y nullcontext para medir fases con with.
+
+#Definimos la clase KruskalStats con las mediciones de una ejecución de kruskal o spanning_trees.
+#Los contadores se suman sobre todos los árboles de la ejecución ('min+max' en spanning_trees).
+class KruskalStats:
+    def __init__(self, mode, engine, node_count, edge_count):
+        self.mode = mode #'min', 'max' o varios unidos con '+'.
+        self.engine = engine #Motor usado (uno de graph.ENGINES o 'scenario' para ScenarioIndex.tree).
+        self.node_count = node_count #Nodos del grafo.
+        self.edge_count = edge_count #Aristas del grafo.
+        self.cached = False #True si el resultado salió completo de la caché.
+        self.phases = {} #Fase -> segundos ('sort', 'gather', 'scan', 'translate', 'engine', 'index').
+        self.scanned = 0 #Aristas recorridas por la pasada de union-find.
+        self.examined = 0 #Aristas recorridas hasta aceptar la última arista del árbol.
+        self.accepted = 0 #Aristas aceptadas en el árbol.
+        self.rejected = 0 #Aristas descartadas por formar ciclo antes de completar el árbol.
+        self.finds = 0 #Llamadas a find.
+        self.unions = 0 #Llamadas a union.
+        self.path_total = 0 #Saltos de padre recorridos por todos los find.
+        self.max_path = 0 #Camino más largo recorrido por un find.
+        self.started = time.perf_counter() #Momento en que empezó la ejecución.
+        self.total = 0.0 #Segundos totales de la ejecución (se fija al terminar).
+
+    #Propiedad con el promedio de saltos por find.
+    @property
+    def average_path(self):
+        return self.path_total / self.finds if self.finds else 0.0
+
+    #Método para medir una fase con with; las fases repetidas se acumulan.
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    #Método para sumar los contadores de una pasada de union-find.
+    def add_scan(self, sets, scanned, accepted, last_accepted):
+        examined = last_accepted + 1 if accepted else 0
+        self.scanned += scanned
+        self.examined += examined
+        self.accepted += accepted
+        self.rejected += examined - accepted
+        self.finds += sets.finds
+        self.unions += sets.unions
+        self.path_total += sets.path_total
+        self.max_path = max(self.max_path, sets.max_path)
+
+    #Método para convertir las mediciones en un diccionario listo para JSON o para un sistema de métricas.
+    def as_dict(self):
+        return {
+            'mode': self.mode,
+            'engine': self.engine,
+            'nodes': self.node_count,
+            'edges': self.edge_count,
+            'cached': self.cached,
+            'total_seconds': self.total,
+            'phases': dict(self.phases),
+            'scanned': self.scanned,
+            'examined': self.examined,
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'finds': self.finds,
+            'unions': self.unions,
+            'average_path': self.average_path,
+            'max_path': self.max_path,
+        }
+
+#Definimos la clase Profiler, que se le pasa a Graph para instrumentar sus ejecuciones.
+#Guarda las últimas keep ejecuciones y llama a callback(stats) al terminar cada una.
+class Profiler:
+    def __init__(self, callback=None, keep=100):
+        self.callback = callback #Función opcional que recibe cada KruskalStats.
+        self.runs = deque(maxlen=keep) #Últimas ejecuciones, la más reciente al final.
+
+    #Propiedad con la última ejecución (None si no hay ninguna).
+    @property
+    def last(self):
+        return self.runs[-1] if self.runs else None
+
+    #Método para empezar a medir una ejecución sobre un grafo.
+    def start(self, mode, engine, graph):
+        return KruskalStats(mode, engine, len(graph.labels), len(graph.weights))
+
+    #Método para cerrar una ejecución: fija su tiempo total, la guarda y avisa al callback.
+    def finish(self, stats):
+        stats.total = time.perf_counter() - stats.started
+        self.runs.append(stats)
+        if self.callback is not None:
+            self.callback(stats)
+
+#Función para medir una fase solo si hay estadísticas (sin ellas no hace nada).
+def timed(stats, name):
+    return nullcontext() if stats is None else stats.phase(name)
+
+#Función para medir una ejecución completa si el grafo tiene Profiler: entrega el KruskalStats
+#(o None sin Profiler) y al salir del with lo cierra con finish.
+@contextmanager
+def profiled(graph, mode, engine):
+    if graph.profiler is None:
+        yield None
+        return
+    stats = graph.profiler.start(mode, engine, graph)
+    yield stats
+    graph.profiler.finish(stats)
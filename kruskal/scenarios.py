@@ -0,0 +1,147 @@
+#Índice para recalcular árboles bajo muchos escenarios de pesos sobre la misma topología.
+
+import numpy as np #Importamos numpy para reutilizar y mezclar las permutaciones de orden.
+
+from .profiling import profiled
+from .sorting import check_mode, chunked, reverse_stable
+
+MERGE_LIMIT = 0.25 #Fracción de aristas cambiadas a partir de la cual conviene ordenar de nuevo todo.
+
+#Función para corregir los empates de un orden: con pesos iguales Kruskal respeta el orden en
+#que se agregaron las aristas, así que cada grupo de empates cuyos índices no estén en orden
+#creciente se ordena por índice (solo esos grupos). Devuelve el orden corregido.
+def fix_ties(order, weights):
+    sorted_weights = weights[order]
+    tied = sorted_weights[1:] == sorted_weights[:-1]
+    broken = tied & (order[1:] < order[:-1])
+    if not broken.any():
+        return order
+    group = np.cumsum(np.r_[True, ~tied]) - 1 #Grupo de empates de cada posición.
+    positions = np.flatnonzero(np.isin(group, group[1:][broken]))
+    order = order.copy()
+    order[positions] = order[positions[np.lexsort((order[positions], group[positions]))]]
+    return order
+
+#Función para mezclar en un orden ya ordenado por (peso, índice) unas aristas movidas, también
+#ordenadas por (peso, índice), sin volver a ordenar el resto. Cada arista se reduce a una clave
+#entera: el inicio de su grupo de peso dentro de rest (o justo antes, si su peso no está en
+#rest) y su índice, así que las posiciones de inserción salen de un solo searchsorted.
+def merge_sorted(rest, moved, weights):
+    if len(rest) == 0 or len(moved) == 0:
+        return np.concatenate([rest, moved])
+    edge_count = len(weights)
+    rest_weights = weights[rest]
+    moved_weights = weights[moved]
+    same = (rest_weights[1:] == rest_weights[:-1]) | (np.isnan(rest_weights[1:]) & np.isnan(rest_weights[:-1]))
+    group_start = np.maximum.accumulate(np.where(np.r_[True, ~same], np.arange(len(rest)), 0))
+    rest_keys = 2 * group_start.astype(np.int64) * edge_count + rest
+    low = np.searchsorted(rest_weights, moved_weights, 'left')
+    high = np.searchsorted(rest_weights, moved_weights, 'right')
+    absent = (high == low) & ~np.isnan(moved_weights) #Peso que no aparece en rest: va antes del grupo siguiente.
+    moved_keys = (2 * low.astype(np.int64) - absent) * edge_count + moved
+    return np.insert(rest, np.searchsorted(rest_keys, moved_keys), moved)
+
+#Definimos la clase ScenarioIndex: guarda el orden estable de las aristas por peso (ascendente)
+#calculado una sola vez y lo reutiliza para cada escenario:
+#  tree(transform=f)           f monótona (creciente, o decreciente con decreasing=True) sobre el
+#                              arreglo de pesos: el orden se reutiliza (o se invierte) sin ordenar,
+#                              solo se reordenan los grupos de empates nuevos.
+#  tree(max_weight=, min_weight=)  umbrales: el orden ya filtrado es un tramo contiguo del orden.
+#  tree(keep=mascara)          filtro arbitrario de aristas en O(E), sin ordenar.
+#  reweight(pesos, posiciones) cambios arbitrarios: devuelve otro índice en el que solo se ordenan
+#                              las aristas cambiadas y se mezclan con el resto.
+#Los árboles son idénticos a los de kruskal sobre el grafo con los pesos del escenario.
+class ScenarioIndex:
+    def __init__(self, graph, weights=None, order=None):
+        self.graph = graph #Grafo cuya topología (origen y destino) comparten todos los escenarios.
+        self.fingerprint = graph.fingerprint() #Huella para detectar cambios del grafo.
+        if weights is None:
+            weights = np.frombuffer(graph.weights, dtype=np.float64).copy()
+        self.weights = weights #Pesos base del índice (los del grafo o los de reweight).
+        self.order = np.argsort(weights, kind='stable') if order is None else order #Orden ascendente estable.
+
+    def __len__(self):
+        return len(self.weights)
+
+    #Método para comprobar que el grafo no cambió desde que se creó el índice.
+    def check(self):
+        if self.graph.fingerprint() != self.fingerprint:
+            raise ValueError('El grafo cambió desde que se creó el índice; cree otro con scenario_index')
+
+    #Método para obtener el orden ascendente y los pesos de un escenario con transform.
+    def scenario(self, transform=None, decreasing=False):
+        if transform is None:
+            return self.order, self.weights
+        weights = np.asarray(transform(self.weights), dtype=np.float64)
+        if weights.shape != self.weights.shape:
+            raise ValueError('transform debe devolver un peso por arista')
+        order = self.order
+        missing = np.isnan(weights[order])
+        if missing.any(): #Como en argsort, los pesos NaN van al final y por índice.
+            order = np.concatenate([order[~missing], np.sort(order[missing])])
+        if decreasing:
+            finite = len(order) - int(missing.sum())
+            order = np.concatenate([order[:finite][::-1], order[finite:]])
+        sorted_weights = weights[order]
+        if (sorted_weights[1:] < sorted_weights[:-1]).any():
+            raise ValueError('transform no es monótona en el sentido indicado; use reweight para cambios arbitrarios')
+        return fix_ties(order, weights), weights
+
+    #Método que ejecuta Kruskal sobre un escenario y devuelve los índices de las aristas aceptadas
+    #(en orden de Kruskal) y los pesos del escenario. Los umbrales se aplican a los pesos ya
+    #transformados y keep es una máscara booleana por arista.
+    def select(self, mode='min', transform=None, decreasing=False, min_weight=None, max_weight=None, keep=None, stats=None):
+        check_mode(mode)
+        self.check()
+        order, weights = self.scenario(transform, decreasing)
+        if min_weight is not None or max_weight is not None:
+            sorted_weights = weights[order]
+            start = 0 if min_weight is None else np.searchsorted(sorted_weights, min_weight, 'left')
+            stop = np.searchsorted(sorted_weights, np.inf if max_weight is None else max_weight, 'right')
+            order = order[start:stop]
+        if keep is not None:
+            order = order[np.asarray(keep, dtype=bool)[order]]
+        if mode == 'max': #Como en kruskal, los pesos NaN quedan al final también en modo 'max'.
+            order = reverse_stable(order, weights)
+        _, edges = self.graph.scan_edges(chunked(order, 2 * len(self.graph.labels)), stats)
+        return edges, weights
+
+    #Método para obtener el árbol de un escenario como lista de tuplas (origen, destino, peso),
+    #con los pesos del escenario. Acepta los mismos argumentos que select.
+    def tree(self, mode='min', transform=None, decreasing=False, min_weight=None, max_weight=None, keep=None):
+        with profiled(self.graph, mode, 'scenario') as stats:
+            edges, weights = self.select(mode, transform, decreasing, min_weight, max_weight, keep, stats)
+            labels = self.graph.labels
+            src = np.frombuffer(self.graph.src, dtype=np.intc)[edges].tolist()
+            dst = np.frombuffer(self.graph.dst, dtype=np.intc)[edges].tolist()
+            return [(labels[u], labels[v], w) for u, v, w in zip(src, dst, weights[edges].tolist())]
+
+    #Método para obtener solo el peso total del árbol de un escenario (sin traducir etiquetas).
+    def total(self, mode='min', transform=None, decreasing=False, min_weight=None, max_weight=None, keep=None):
+        edges, weights = self.select(mode, transform, decreasing, min_weight, max_weight, keep)
+        return float(weights[edges].sum())
+
+    #Método para crear el índice de otro escenario con pesos cambiados de forma arbitraria: con
+    #positions, weights son los nuevos pesos de esas aristas; sin positions, weights es el arreglo
+    #completo y se comparan con los actuales para encontrar los cambios. Solo las aristas
+    #cambiadas se ordenan y se mezclan con el resto; si cambia más de MERGE_LIMIT de las aristas
+    #se ordena todo de nuevo. El índice original no cambia.
+    def reweight(self, weights, positions=None):
+        if positions is None:
+            new = np.array(weights, dtype=np.float64)
+            if new.shape != self.weights.shape:
+                raise ValueError('weights debe tener un peso por arista (o indicar positions)')
+            same = (new == self.weights) | (np.isnan(new) & np.isnan(self.weights))
+            changed = np.flatnonzero(~same)
+        else:
+            new = self.weights.copy()
+            positions = np.asarray(positions, dtype=np.intp)
+            new[positions] = weights
+            changed = np.unique(positions)
+        if len(changed) > MERGE_LIMIT * len(new):
+            return ScenarioIndex(self.graph, new)
+        moved = np.zeros(len(new), dtype=bool)
+        moved[changed] = True
+        rest = self.order[~moved[self.order]] #Sigue ordenado por (peso, índice).
+        changed = changed[np.argsort(new[changed], kind='stable')] #changed va por índice creciente: estable.
+        return ScenarioIndex(self.graph, new, merge_sorted(rest, changed, new))
@@ -0,0 +1,258 @@
+#Servicio asyncio que calcula árboles de expansión sobre un socket local (TCP o Unix).
+#Protocolo: una petición JSON por línea y una respuesta JSON por línea.
+#  petición:  {"id": 1, "mode": "min"|"max"|"both", "edges": [[origen, destino, peso], ...],
+#              "undirected": false, "conflict": "min"}   (solo "edges" es obligatorio)
+#  respuesta: {"id": 1, "nodes": ..., "edges": ..., "min": {"weight": ..., "edges": [...]}, ...}
+#             o {"id": 1, "error": "..."}; {"op": "stats"} devuelve los contadores del servidor.
+#Los procesos de cálculo se crean una vez y se calientan al arrancar; las peticiones idénticas
+#que llegan a la vez comparten un solo cálculo; con max_pending peticiones en curso el servidor
+#deja de leer del socket (contrapresión) y cada petición tiene un tiempo límite. Las peticiones
+#se leen (JSON) en los procesos de cálculo, así que una petición grande no detiene a las demás.
+#Uso: python -m kruskal.server --port 8765 --workers 4   (o --unix /tmp/kruskal.sock)
+
+import argparse #Importamos argparse para leer las opciones de la línea de comandos.
+import asyncio #Importamos asyncio para atender muchas conexiones en un solo hilo.
+import hashlib #Importamos hashlib para reconocer peticiones idénticas.
+import json #Importamos json para el protocolo.
+import os #Importamos os para saber cuántos núcleos hay.
+from concurrent.futures import ProcessPoolExecutor #Importamos ProcessPoolExecutor para los procesos de cálculo.
+from concurrent.futures.process import BrokenProcessPool #Importamos BrokenProcessPool para recuperar el grupo si un proceso muere.
+
+from .cli import MODES, tree_results
+from .graph import Graph
+
+INLINE_BYTES = 64 * 1024 #Tamaño hasta el que una petición también se lee en el bucle de eventos (menos de 1 ms).
+
+#Función que se ejecuta al arrancar cada proceso: carga numpy y el paquete y resuelve un grafo
+#pequeño, para que la primera petición real no pague esos costos.
+def warm_worker():
+    Graph.from_edges([('a', 'b', 1.0), ('b', 'c', 2.0)]).spanning_trees(('min', 'max'))
+
+#Función para leer una línea de petición como objeto JSON.
+def parse_request(line):
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError('La petición debe ser un objeto JSON')
+    return request
+
+#Función para obtener los modos de una petición ya leída.
+def request_modes(request):
+    mode = request.get('mode', 'both')
+    if not isinstance(mode, str) or mode not in MODES:
+        raise ValueError(f"Modo desconocido {mode!r}; use 'min', 'max' o 'both'")
+    return MODES[mode]
+
+#Función para convertir una respuesta en una línea JSON.
+def encode_response(response):
+    return json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n'
+
+#Función para anteponer el id a una respuesta ya codificada sin id (que nunca está vacía).
+def with_id(request_id, body):
+    return b'{"id":' + json.dumps(request_id, ensure_ascii=False).encode('utf-8') + b',' + body[1:]
+
+#Función que lee y resuelve una línea de petición en un proceso de cálculo. Devuelve (id, error,
+#respuesta ya codificada sin id), para que ni la lectura ni la escritura del JSON ocupen el bucle
+#de eventos; sin el id, la misma respuesta sirve a todas las peticiones que comparten el cálculo.
+#Los errores (JSON inválido, grafo inválido) vuelven al cliente en la respuesta.
+def solve_request(line):
+    request_id = None
+    try:
+        request = parse_request(line)
+        request_id = request.get('id')
+        modes = request_modes(request)
+        graph = Graph.from_edges(request['edges'], request.get('undirected', False), request.get('conflict', 'min'))
+        response = tree_results(graph, graph.spanning_trees(modes), modes)
+    except ValueError as error:
+        response = {'error': str(error)}
+    except Exception as error: #Cualquier otro fallo del cálculo vuelve al cliente como error.
+        response = {'error': f'{type(error).__name__}: {error}'}
+    return request_id, response.get('error'), encode_response(response)
+
+#Función con la clave de una petición ya leída: dos peticiones con la misma clave dan el mismo
+#resultado (el id no cuenta).
+def request_key(request):
+    fields = {key: request.get(key) for key in ('mode', 'edges', 'undirected', 'conflict')}
+    return hashlib.blake2b(json.dumps(fields, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+#Función con la clave de una petición grande sin leerla: el hash de la línea tal como llegó, así
+#que solo las líneas idénticas comparten un cálculo. Se calcula en un hilo (hashlib suelta el GIL
+#con datos grandes) para no ocupar el bucle de eventos.
+def line_key(line):
+    return hashlib.blake2b(line).hexdigest()
+
+#Definimos la clase TreeServer con el grupo de procesos, las peticiones en curso y los contadores.
+class TreeServer:
+    def __init__(self, workers=None, max_pending=64, timeout=30.0, max_request_bytes=64 * 1024 * 1024):
+        self.workers = workers or os.cpu_count() or 1 #Procesos de cálculo.
+        self.max_pending = max_pending #Peticiones en curso antes de dejar de leer del socket.
+        self.timeout = timeout #Segundos máximos por petición, contados desde que se leyó (incluida la espera por un lugar).
+        self.max_request_bytes = max_request_bytes #Tamaño máximo de una línea de petición.
+        self.executor = None #Grupo de procesos (se crea en start).
+        self.slots = None #Semáforo con los lugares libres; cada petición lo ocupa hasta que su cálculo termina.
+        self.in_flight = {} #Clave de petición -> futuro del cálculo compartido.
+        self.server = None #Servidor de asyncio.
+        self.counters = {'requests': 0, 'solved': 0, 'coalesced': 0, 'timeouts': 0, 'errors': 0}
+
+    #Método para arrancar el servidor en host:port o, con path, en un socket Unix.
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        self.executor = ProcessPoolExecutor(self.workers, initializer=warm_worker)
+        self.slots = asyncio.Semaphore(self.max_pending)
+        #Arrancamos y calentamos todos los procesos antes de aceptar conexiones.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, warm_worker) for _ in range(self.workers)))
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_connection, path, limit=self.max_request_bytes)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port, limit=self.max_request_bytes)
+        return self.server
+
+    #Método para detener el servidor y los procesos de cálculo.
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    #Método que atiende una conexión: lee peticiones línea por línea y responde cada una en su
+    #propia tarea (las respuestas pueden llegar en otro orden; el id permite emparejarlas).
+    async def handle_connection(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError: #La línea supera max_request_bytes: no se puede seguir leyendo.
+                    self.send(writer, {'id': None, 'error': f'Petición de más de {self.max_request_bytes} bytes'})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                #Contrapresión: sin lugares libres dejamos de leer y el cliente termina esperando.
+                deadline = asyncio.get_running_loop().time() + self.timeout
+                try:
+                    await asyncio.wait_for(self.slots.acquire(), self.timeout)
+                except asyncio.TimeoutError:
+                    self.counters['timeouts'] += 1
+                    self.send(writer, {'id': None, 'error': 'Servidor ocupado: no hubo lugar dentro del tiempo límite'})
+                    continue
+                task = asyncio.create_task(self.respond(line, writer, deadline))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    #Método que resuelve una petición y escribe su respuesta antes de deadline (tiempo del bucle).
+    #Las peticiones pequeñas también se leen aquí, para atender {"op": "stats"} y conocer el id
+    #aunque se agote el tiempo; las grandes solo se leen en los procesos (si se agota su tiempo,
+    #la respuesta lleva id null). El lugar se libera cuando termina el cálculo, aunque la
+    #respuesta ya haya salido por tiempo límite: los cálculos abandonados siguen ocupando un
+    #proceso y deben seguir contando para la contrapresión.
+    async def respond(self, line, writer, deadline):
+        loop = asyncio.get_running_loop()
+        request_id = None
+        future = None
+        payload = None #Línea de respuesta ya codificada por el proceso de cálculo.
+        try:
+            request = parse_request(line) if len(line) <= INLINE_BYTES else None
+            if request is not None:
+                request_id = request.get('id')
+                request_modes(request) #Un modo inválido se informa sin pasar por los procesos.
+            if request is not None and request.get('op') == 'stats':
+                response = self.stats()
+            else:
+                self.counters['requests'] += 1
+                key = request_key(request) if request is not None else await loop.run_in_executor(None, line_key, line)
+                future = self.solve(line, key)
+                solved_id, error, body = await asyncio.wait_for(asyncio.shield(future), max(0.0, deadline - loop.time()))
+                if request is None:
+                    request_id = solved_id
+                payload = with_id(request_id, body)
+                response = {} if error is None else {'error': error}
+        except asyncio.TimeoutError:
+            self.counters['timeouts'] += 1
+            response = {'error': f'Tiempo límite de {self.timeout} s agotado'}
+        except ValueError as error:
+            response = {'error': str(error)}
+        except Exception as error: #Por ejemplo, un proceso de cálculo caído (BrokenProcessPool).
+            response = {'error': f'{type(error).__name__}: {error}'}
+        finally:
+            if future is None:
+                self.slots.release()
+            else:
+                future.add_done_callback(lambda _: self.slots.release())
+        if 'error' in response:
+            self.counters['errors'] += 1
+        if payload is not None:
+            writer.write(payload)
+        else:
+            self.send(writer, {'id': request_id, **response})
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    #Método que resuelve una línea de petición en el grupo de procesos; si ya hay una idéntica en
+    #curso se espera su resultado en lugar de calcularlo otra vez.
+    def solve(self, line, key):
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return future
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self.executor, solve_request, line)
+        except BrokenProcessPool: #Un proceso murió: las peticiones en curso fallan y se crea otro grupo.
+            self.executor.shutdown(wait=False)
+            self.executor = ProcessPoolExecutor(self.workers, initializer=warm_worker)
+            future = loop.run_in_executor(self.executor, solve_request, line)
+        self.in_flight[key] = future
+        self.counters['solved'] += 1
+        future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return future
+
+    #Método con los contadores del servidor.
+    def stats(self):
+        return {**self.counters, 'in_flight': len(self.in_flight), 'workers': self.workers,
+                'free_slots': self.slots._value if self.slots is not None else None}
+
+    #Método para escribir una respuesta como una línea JSON.
+    def send(self, writer, response):
+        writer.write(encode_response(response))
+
+#Función para leer las opciones de la línea de comandos.
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kruskal.server', description='Servicio local de árboles de expansión mínima/máxima.')
+    parser.add_argument('--host', default='127.0.0.1', help='Dirección donde escuchar.')
+    parser.add_argument('--port', type=int, default=8765, help='Puerto TCP.')
+    parser.add_argument('--unix', metavar='RUTA', help='Escucha en un socket Unix en lugar de TCP.')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos de cálculo (por omisión uno por núcleo).')
+    parser.add_argument('--max-pending', type=int, default=64, help='Peticiones en curso antes de aplicar contrapresión.')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Segundos máximos por petición.')
+    parser.add_argument('--max-request-mb', type=float, default=64, help='Tamaño máximo de una petición en MB.')
+    return parser.parse_args(argv)
+
+async def serve(args):
+    server = TreeServer(args.workers, args.max_pending, args.timeout, int(args.max_request_mb * 1024 * 1024))
+    await server.start(args.host, args.port, args.unix)
+    where = args.unix or f'{args.host}:{args.port}'
+    print(f'Escuchando en {where} con {server.workers} procesos', flush=True)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
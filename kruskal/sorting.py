@@ -0,0 +1,60 @@
+#Utilidades de ordenamiento compartidas por los motores de Kruskal.
+
+import numpy as np #Importamos numpy para trabajar con las permutaciones de orden.
+
+from .profiling import timed
+
+#Función para validar un modo de árbol ('min' o 'max'): el sentido en que se ordenan las aristas.
+def check_mode(mode):
+    if mode not in ('min', 'max'):
+        raise ValueError(f"Modo desconocido {mode!r}; use 'min' o 'max'")
+
+#Función para convertir un orden ascendente (estable) de weights en descendente sin volver a
+#ordenar. Al invertir, los empates quedarían al revés del orden de inserción, así que cada
+#grupo de pesos iguales se vuelve a invertir para conservar la estabilidad. Los pesos NaN, que
+#el orden ascendente deja al final, se quedan al final y por índice, como en argsort(-weights).
+def reverse_stable(order, weights):
+    finite = len(order) - int(np.isnan(weights[order]).sum())
+    reverse = order[:finite][::-1]
+    if len(reverse) == 0:
+        return order
+    weights = weights[reverse] #Pesos en orden descendente.
+    starts = np.flatnonzero(np.r_[True, weights[1:] != weights[:-1]]) #Inicio de cada grupo de empates.
+    ends = np.r_[starts[1:], len(reverse)] #Fin (exclusivo) de cada grupo de empates.
+    group = np.repeat(np.arange(len(starts)), ends - starts) #Grupo al que pertenece cada posición.
+    reverse = reverse[starts[group] + ends[group] - 1 - np.arange(len(reverse))]
+    return np.concatenate([reverse, order[finite:]]) if finite < len(order) else reverse
+
+#Función generadora que parte un orden ya calculado en bloques crecientes (first, 2 * first, ...),
+#para que Kruskal pueda dejar de reunir aristas en cuanto el árbol está completo.
+def chunked(order, first=4096):
+    start = 0
+    size = max(1, first)
+    while start < len(order):
+        yield order[start:start + size]
+        start += size
+        size *= 2
+
+#Función generadora que entrega los índices de keys en orden ascendente estable, por bloques y
+#bajo demanda, sin ordenar todo el arreglo: cada bloque toma las first (2 * first, ...) claves
+#más pequeñas que quedan con una selección parcial (np.partition) y solo ordena esas. El bloque
+#incluye todos los empates con su última clave, así que el resultado concatenado es idéntico a
+#np.argsort(keys, kind='stable'). Con stats se acumula el tiempo en la fase 'sort'.
+def lazy_order(keys, first=4096, stats=None):
+    remaining = np.arange(len(keys))
+    size = max(1, first)
+    while len(remaining):
+        with timed(stats, 'sort'):
+            values = keys[remaining]
+            if len(remaining) > size:
+                threshold = np.partition(values, size - 1)[size - 1]
+            if len(remaining) <= size or np.isnan(threshold): #Lo que queda se ordena de una vez.
+                block = remaining[np.argsort(values, kind='stable')]
+                remaining = remaining[:0]
+            else:
+                low = values <= threshold #Incluye todos los empates con la última clave del bloque.
+                block = remaining[low]
+                block = block[np.argsort(values[low], kind='stable')] #remaining va por índice creciente: estable.
+                remaining = remaining[~low]
+        yield block
+        size *= 2
@@ -0,0 +1,144 @@
+#Kruskal en flujo para archivos de aristas más grandes que la memoria.
+
+import csv #Importamos csv para leer aristas desde archivos de texto.
+import heapq #Importamos heapq para la mezcla de k vías del ordenamiento externo.
+import json #Importamos json para leer aristas en NDJSON.
+import tempfile #Importamos tempfile para los bloques temporales del ordenamiento externo.
+from operator import itemgetter #Importamos itemgetter para ordenar aristas por peso.
+
+from .disjoint_set import DisjointSet
+from .formats import EDGE_RECORD
+
+#Función generadora que lee aristas (origen, destino, peso) de un archivo sin cargarlo completo.
+#Los archivos .bin contienen registros EDGE_RECORD, los .ndjson/.jsonl un objeto JSON por línea,
+#los .tsv van separados por tabuladores y cualquier otro por comas.
+def read_edges(path, chunk_records=65536):
+    if path.endswith('.bin'):
+        with open(path, 'rb') as file:
+            yield from read_records(file, chunk_records)
+        return
+    with open(path, newline='') as file:
+        if path.endswith(('.ndjson', '.jsonl')):
+            yield from read_ndjson_edges(file)
+        else:
+            yield from read_text_edges(file, '\t' if path.endswith('.tsv') else ',')
+
+#Función generadora que lee aristas de un archivo de texto ya abierto (un archivo o la entrada
+#estándar). Las filas cuyo peso no es numérico, como el encabezado, se omiten.
+def read_text_edges(file, delimiter=','):
+    for row in csv.reader(file, delimiter=delimiter):
+        if len(row) < 3:
+            continue
+        try:
+            weight = float(row[2])
+        except ValueError:
+            continue
+        yield row[0], row[1], weight
+
+#Función generadora que lee aristas en NDJSON: cada línea es una lista [origen, destino, peso]
+#o un objeto {"src": ..., "dst": ..., "weight": ...}. Las líneas vacías se omiten. Las etiquetas
+#deben ser textos o números y el peso un número; si no, el error indica la línea.
+def read_ndjson_edges(file):
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if isinstance(record, dict):
+            record = [record.get('src'), record.get('dst'), record.get('weight')]
+        if not isinstance(record, list) or len(record) != 3:
+            raise ValueError(f'Línea {number}: se esperaba [origen, destino, peso] o {{"src", "dst", "weight"}}')
+        from_node, to_node, weight = record
+        for label in (from_node, to_node):
+            if isinstance(label, bool) or not isinstance(label, (str, int, float)):
+                raise ValueError(f'Línea {number}: la etiqueta {label!r} no es un texto ni un número')
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise ValueError(f'Línea {number}: el peso {weight!r} no es un número')
+        yield from_node, to_node, float(weight)
+
+#Función generadora que lee registros EDGE_RECORD de un archivo abierto en bloques.
+def read_records(file, chunk_records=65536):
+    while True:
+        chunk = file.read(EDGE_RECORD.size * chunk_records)
+        if not chunk:
+            return
+        yield from EDGE_RECORD.iter_unpack(chunk)
+
+#Función para escribir aristas (ya ordenadas) en un archivo temporal y devolverlo listo para leer.
+def write_run(edges, temp_dir=None):
+    run = tempfile.TemporaryFile(dir=temp_dir)
+    pack = EDGE_RECORD.pack
+    for edge in edges:
+        run.write(pack(*edge))
+    run.seek(0)
+    return run
+
+#Función generadora que ordena aristas (u, v, peso) con ids enteros usando memoria externa:
+#ordena bloques de buffer_size aristas, los guarda en archivos temporales y los mezcla
+#con una mezcla de k vías. Si hay más de fan_in bloques se mezclan por etapas.
+def external_sort_edges(edges, find_minimum=True, buffer_size=1_000_000, temp_dir=None, fan_in=64):
+    reverse = not find_minimum #Descendente para el árbol máximo.
+    key = itemgetter(2) #Ordenamos por peso; sort y heapq.merge son estables.
+    runs = [] #Archivos temporales con bloques ordenados.
+    try:
+        buffer = []
+        for edge in edges:
+            buffer.append(edge)
+            if len(buffer) >= buffer_size: #El bloque está lleno: lo ordenamos y lo guardamos en disco.
+                buffer.sort(key=key, reverse=reverse)
+                runs.append(write_run(buffer, temp_dir))
+                buffer = []
+        buffer.sort(key=key, reverse=reverse)
+        if not runs: #Todo cupo en memoria; no hace falta tocar el disco.
+            yield from buffer
+            return
+        runs.append(write_run(buffer, temp_dir))
+        del buffer
+
+        #Mezclamos por etapas hasta que queden como máximo fan_in bloques.
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                chunk_records = max(1, buffer_size // len(group))
+                streams = [read_records(run, chunk_records) for run in group]
+                merged.append(write_run(heapq.merge(*streams, key=key, reverse=reverse), temp_dir))
+                for run in group:
+                    run.close()
+            runs = merged
+
+        #Mezcla final; cada bloque lee solo su parte del buffer a la vez.
+        chunk_records = max(1, buffer_size // len(runs))
+        streams = [read_records(run, chunk_records) for run in runs]
+        yield from heapq.merge(*streams, key=key, reverse=reverse)
+    finally:
+        for run in runs:
+            run.close()
+
+#Función para calcular el árbol de expansión mínima o máxima de un flujo de aristas que no
+#cabe en memoria. source puede ser una ruta (ver read_edges) o cualquier iterable de tuplas
+#(origen, destino, peso). La memoria queda acotada por O(V) más buffer_size aristas.
+def stream_kruskal(source, find_minimum=True, buffer_size=1_000_000, temp_dir=None):
+    if isinstance(source, str):
+        source = read_edges(source)
+    ids = {} #Etiqueta -> identificador entero.
+    labels = [] #Identificador entero -> etiqueta.
+    sets = DisjointSet() #Conjuntos disjuntos que crecen conforme aparecen nodos.
+
+    #Generador que traduce las etiquetas a ids para que los archivos temporales sean binarios.
+    def to_ids(edges):
+        for from_node, to_node, weight in edges:
+            u = ids.get(from_node)
+            if u is None:
+                u = ids[from_node] = sets.add()
+                labels.append(from_node)
+            v = ids.get(to_node)
+            if v is None:
+                v = ids[to_node] = sets.add()
+                labels.append(to_node)
+            yield u, v, weight
+
+    spanning_tree = []
+    for u, v, weight in external_sort_edges(to_ids(source), find_minimum, buffer_size, temp_dir):
+        if sets.union(u, v): #No forma ciclo.
+            spanning_tree.append((labels[u], labels[v], weight))
+    return spanning_tree